@@ -1,24 +1,199 @@
-from flask import Flask
+from flask import Flask, request
 from flask_cors import CORS
-import pandas as pd
-import os
+from functools import lru_cache
+from pathlib import Path
+import numpy as np
+
+from climate_data import ERA_DAY_RANGES, get_climate_data
+from response_cache import ResponseCache
+import climate_stats
+import wire_formats
 
 # Import the data
-csv_path = os.path.join(os.path.dirname(__file__), "nasa_data.csv")
-df = pd.read_csv(csv_path)
+climate = get_climate_data()
 
-data = df.to_dict(orient="records")
+# Column arrays so /data can slice instead of walking a list of dicts
+COLUMNS = list(climate.columns)
+COLUMN_ARRAYS = dict(climate.float64_arrays())
+COLUMN_ARRAYS["day"] = np.arange(climate.n_days)
+# Binary formats ship float32; slices of these are views, not copies
+FLOAT32_ARRAYS = dict(climate.arrays)
+FLOAT32_ARRAYS["day"] = COLUMN_ARRAYS["day"].astype("<f4")
+N_DAYS = climate.n_days
+MAX_LIMIT = 1000
+# Maximum-level compressions of the full dataset, written at build time by precompress.py
+PRECOMPRESSED_DIR = Path(__file__).with_name("precompressed")
 
 app = Flask(__name__)
 CORS(app)
 
+# nasa_data.csv is static for the life of the process, so each query shape is serialized once
+response_cache = ResponseCache()
+
+
+def parse_int_arg(args, name, default, minimum=0, maximum=None):
+    """Read a non-negative integer query parameter, raising ValueError if invalid"""
+    raw = args.get(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValueError(f"'{name}' must be an integer")
+    if value < minimum or (maximum is not None and value > maximum):
+        raise ValueError(f"'{name}' must be between {minimum} and {maximum if maximum is not None else 'infinity'}")
+    return value
+
+
+def parse_columns_arg(args):
+    """Read the columns= projection, defaulting to every CSV column"""
+    if not args.get("columns"):
+        return tuple(COLUMNS)
+    columns = [c.strip() for c in args["columns"].split(",") if c.strip()]
+    unknown = [c for c in columns if c not in COLUMN_ARRAYS]
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+    return tuple(columns)
+
+
+def parse_data_query(args):
+    """Turn /data query parameters into the day window and columns to send"""
+    start = parse_int_arg(args, "start", 0, maximum=N_DAYS - 1)
+    end = parse_int_arg(args, "end", N_DAYS - 1)
+    end = min(end, N_DAYS - 1)
+    if end < start:
+        raise ValueError("'end' must not be before 'start'")
+
+    columns = parse_columns_arg(args)
+
+    # The cursor is the day to resume from, as handed out in X-Next-Cursor
+    cursor = parse_int_arg(args, "cursor", start, minimum=start, maximum=end)
+    limit = parse_int_arg(args, "limit", None, minimum=1, maximum=MAX_LIMIT)
+
+    # data_range bounds in app.py are inclusive, so stop is end + 1
+    stop = end + 1
+    next_cursor = None
+    if limit is not None and cursor + limit < stop:
+        stop = cursor + limit
+        next_cursor = stop
+
+    return {
+        "start": cursor,
+        "stop": stop,
+        "columns": columns,
+        "next_cursor": next_cursor,
+        "total": end + 1 - start,
+    }
+
+
+def slice_records(start, stop, columns):
+    """Build row dicts for days [start, stop) from the column arrays"""
+    sliced = [COLUMN_ARRAYS[col][start:stop].tolist() for col in columns]
+    return [dict(zip(columns, row)) for row in zip(*sliced)]
+
+
+def build_data_response(query, fmt="json"):
+    """Serialize one /data page in the requested wire format for the response cache"""
+    start, stop, columns = query["start"], query["stop"], query["columns"]
+    if fmt == "arrow":
+        body = wire_formats.encode_arrow(columns, [FLOAT32_ARRAYS[col][start:stop] for col in columns])
+    elif fmt == "npy":
+        body = wire_formats.encode_npy([FLOAT32_ARRAYS[col][start:stop] for col in columns])
+    elif fmt == "msgpack":
+        body = wire_formats.encode_msgpack({col: COLUMN_ARRAYS[col][start:stop].tolist() for col in columns})
+    else:
+        body = wire_formats.encode_json(slice_records(start, stop, columns))
+
+    headers = {
+        "X-Total-Count": str(query["total"]),
+        "X-Columns": ",".join(columns),
+        "Access-Control-Expose-Headers": "ETag, X-Columns, X-Next-Cursor, X-Total-Count",
+        "Vary": "Accept",
+    }
+    if query["next_cursor"] is not None:
+        headers["X-Next-Cursor"] = str(query["next_cursor"])
+    return body, wire_formats.FORMAT_MIMETYPES[fmt], headers
+
+
+def data_cache_key(query, fmt):
+    return ("data", fmt) + tuple(sorted(query.items()))
+
+
+@lru_cache(maxsize=256)
+def era_stats(era, window, columns):
+    """Aggregates for one era, memoized per (era, window, columns)"""
+    first, last = climate.era_bounds(era)
+    n_days = last + 1 - first
+    if window is not None and window > n_days:
+        raise ValueError(f"'window' must not exceed the {n_days} days in {era}")
+
+    block = np.vstack([COLUMN_ARRAYS[col][first:last + 1] for col in columns])
+    return {
+        "era": era,
+        "start": first,
+        "end": last,
+        "days": n_days,
+        "window": window,
+        "columns": climate_stats.summarize(COLUMN_ARRAYS["day"][first:last + 1], block, columns, window),
+    }
+
+
+def build_stats_response(eras, window, columns, fmt):
+    stats = {era: era_stats(era, window, columns) for era in eras}
+    if len(eras) == 1:
+        stats = stats[eras[0]]
+    if fmt == "msgpack":
+        body = wire_formats.encode_msgpack(stats)
+    else:
+        body = wire_formats.encode_json(stats)
+    return body, wire_formats.FORMAT_MIMETYPES[fmt], {"Vary": "Accept"}
+
+
+# Warm the cache with the full dataset, the shape every frontend asks for first. Only the
+# JSON is built here; its compressed variants come from PRECOMPRESSED_DIR when present
+_full_query = parse_data_query({})
+full_data_entry = response_cache.get(data_cache_key(_full_query, "json"), lambda: build_data_response(_full_query))
+full_data_entry.load_precompressed(PRECOMPRESSED_DIR)
+
+
 @app.route("/")
 def hello_world():
     return "Flask home route"
 
 @app.route("/data")
 def get_data():
-    return data
+    try:
+        query = parse_data_query(request.args)
+    except ValueError as e:
+        return {"error": str(e)}, 400
+    try:
+        fmt = wire_formats.negotiate_format(request)
+    except ValueError as e:
+        return {"error": str(e)}, 406
+
+    return response_cache.respond(data_cache_key(query, fmt), lambda: build_data_response(query, fmt), request)
+
+@app.route("/stats")
+@app.route("/stats/<era>")
+def get_stats(era=None):
+    if era is not None and era not in ERA_DAY_RANGES:
+        return {"error": f"Unknown era '{era}'", "eras": list(ERA_DAY_RANGES)}, 404
+    eras = (era,) if era else tuple(ERA_DAY_RANGES)
+
+    try:
+        window = parse_int_arg(request.args, "window", None, minimum=1, maximum=N_DAYS)
+        columns = parse_columns_arg(request.args)
+        for name in eras:
+            era_stats(name, window, columns)
+    except ValueError as e:
+        return {"error": str(e)}, 400
+    try:
+        fmt = wire_formats.negotiate_format(request, [f for f in ("json", "msgpack") if f in wire_formats.available_formats()])
+    except ValueError as e:
+        return {"error": str(e)}, 406
+
+    key = ("stats", fmt, eras, window, columns)
+    return response_cache.respond(key, lambda: build_stats_response(eras, window, columns, fmt), request)
 
 # if __name__ == "__main__":
-#     app.run()
\ No newline at end of file
+#     app.run()
@@ -0,0 +1,34 @@
+"""Compare dataset startup cost: pd.read_csv vs building and memory-mapping the float32 cache.
+
+Run from the Backend directory: python bench_climate_data.py
+"""
+import shutil
+import tempfile
+import timeit
+
+import pandas as pd
+
+from climate_data import CSV_PATH, load_climate_data
+
+
+def main(repeat=50):
+    cache_dir = tempfile.mkdtemp(prefix="climate-bench-")
+    try:
+        parse = timeit.timeit(lambda: pd.read_csv(CSV_PATH), number=repeat) / repeat
+
+        def cold():
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            load_climate_data(cache_dir=cache_dir)
+
+        build = timeit.timeit(cold, number=repeat) / repeat
+        warm = timeit.timeit(lambda: load_climate_data(cache_dir=cache_dir), number=repeat) / repeat
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    print(f"pd.read_csv (today)       {parse * 1e3:8.3f} ms")
+    print(f"first start (parse+cache) {build * 1e3:8.3f} ms")
+    print(f"later starts (mmap)       {warm * 1e3:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Compare /data payload size and client decode time across wire formats.
+
+Run from the Backend directory: python bench_wire_formats.py
+"""
+import gzip
+import io
+import json
+import timeit
+
+import numpy as np
+
+import wire_formats
+from app import app
+
+
+def decode_json(body):
+    return json.loads(body)
+
+
+def decode_arrow(body):
+    with wire_formats.pa.ipc.open_stream(body) as reader:
+        return reader.read_all()
+
+
+def decode_npy(body):
+    return np.load(io.BytesIO(body), allow_pickle=False)
+
+
+def decode_msgpack(body):
+    return wire_formats.msgpack.unpackb(body)
+
+
+DECODERS = {
+    "json": decode_json,
+    "arrow": decode_arrow,
+    "npy": decode_npy,
+    "msgpack": decode_msgpack,
+}
+
+
+def main(repeat=200):
+    client = app.test_client()
+    print(f"{'format':<8} {'bytes':>8} {'gzip':>8} {'decode (us)':>12}")
+    for fmt in wire_formats.available_formats():
+        body = client.get(f"/data?format={fmt}").data
+        decode = DECODERS[fmt]
+        seconds = timeit.timeit(lambda: decode(body), number=repeat) / repeat
+        print(f"{fmt:<8} {len(body):>8} {len(gzip.compress(body)):>8} {seconds * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Shared access to the NASA POWER daily series in nasa_data.csv.
+
+The CSV is parsed once and stored as a float32 (n_columns, n_days) .npy next
+to a small JSON sidecar with the column names. Later startups memory-map that
+file instead of parsing text. Cache files are named after a hash of the CSV
+contents, so editing the CSV invalidates them automatically.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CSV_PATH = Path(__file__).with_name("nasa_data.csv")
+CACHE_DIR = Path(os.getenv("CLIMATE_CACHE_DIR", Path(__file__).with_name(".cache")))
+
+# Inclusive day bounds of each era in the dataset, used as ERAS[...]["data_range"]
+ERA_DAY_RANGES = {
+    "1960s": (0, 73),
+    "1980s": (74, 146),
+    "2000s": (147, 219),
+    "2010s": (220, 292),
+    "2020s": (293, 366),
+}
+
+
+class ClimateData:
+    """Column-major float32 view of the dataset with pandas/float64 adapters"""
+
+    def __init__(self, columns, values, source):
+        self.columns = tuple(columns)
+        self.values = values
+        self.source = source
+        self.n_days = values.shape[1]
+        self.arrays = {col: values[i] for i, col in enumerate(self.columns)}
+        self._float64 = None
+        self._frame = None
+
+    def column(self, name):
+        return self.arrays[name]
+
+    def float64_arrays(self):
+        """float64 copies that print like the CSV (20.89, not 20.889999389648438)"""
+        if self._float64 is None:
+            # Going through the shortest float32 repr undoes the float32 rounding noise
+            widened = np.asarray(self.values).astype(str).astype(np.float64)
+            self._float64 = {col: widened[i] for i, col in enumerate(self.columns)}
+        return self._float64
+
+    def frame(self):
+        """DataFrame with a 'day' column, shaped like the old load_nasa_data() result"""
+        if self._frame is None:
+            df = pd.DataFrame(self.float64_arrays(), columns=list(self.columns))
+            df['day'] = range(len(df))
+            self._frame = df
+        return self._frame
+
+    def iter_days(self, *names):
+        """Stream the named columns one day at a time, as tuples of floats"""
+        return zip(*(self.arrays[name].tolist() for name in names))
+
+    def era_bounds(self, era):
+        first, last = ERA_DAY_RANGES[era]
+        return first, min(last, self.n_days - 1)
+
+
+def _csv_digest(csv_path):
+    return hashlib.blake2b(Path(csv_path).read_bytes(), digest_size=8).hexdigest()
+
+
+def _writable_cache_dir(cache_dir):
+    """Use cache_dir if we can write there, else the temp dir (e.g. read-only serverless bundles)"""
+    for candidate in (Path(cache_dir), Path(tempfile.gettempdir()) / "shambabyte-cache"):
+        try:
+            candidate.mkdir(parents=True, exist_ok=True)
+            if os.access(candidate, os.W_OK):
+                return candidate
+        except OSError:
+            continue
+    return None
+
+
+def _replace_atomically(path, write):
+    """Write through a unique temp file and rename it over path.
+
+    Several workers can build a cold cache at once; each writes its own temp
+    file and the last rename wins, which is fine since they all hold the same bytes.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _build_cache(csv_path, npy_path, columns_path):
+    df = pd.read_csv(csv_path, encoding="utf-8-sig")
+    values = np.ascontiguousarray(df.to_numpy(dtype="<f4").T)
+
+    # Columns first: a reader only trusts the cache once the .npy exists
+    _replace_atomically(columns_path, lambda f: f.write(json.dumps(list(df.columns)).encode()))
+    _replace_atomically(npy_path, lambda f: np.save(f, values, allow_pickle=False))
+    return list(df.columns), values
+
+
+def load_climate_data(csv_path=CSV_PATH, cache_dir=CACHE_DIR):
+    """Load the dataset, memory-mapping the float32 cache when it is up to date"""
+    csv_path = Path(csv_path)
+    digest = _csv_digest(csv_path)
+    directory = _writable_cache_dir(cache_dir)
+    if directory is None:
+        df = pd.read_csv(csv_path, encoding="utf-8-sig")
+        return ClimateData(df.columns, np.ascontiguousarray(df.to_numpy(dtype="<f4").T), "csv")
+
+    npy_path = directory / f"{csv_path.stem}-{digest}.npy"
+    columns_path = directory / f"{csv_path.stem}-{digest}.columns.json"
+    if npy_path.exists() and columns_path.exists():
+        columns = json.loads(columns_path.read_text())
+        return ClimateData(columns, np.load(npy_path, mmap_mode="r"), "mmap")
+
+    columns, values = _build_cache(csv_path, npy_path, columns_path)
+    return ClimateData(columns, values, "csv")
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def get_climate_data():
+    """The process-wide ClimateData instance, loaded on first use"""
+    global _shared
+    if _shared is None:
+        with _shared_lock:
+            if _shared is None:
+                _shared = load_climate_data()
+    return _shared
@@ -0,0 +1,39 @@
+import numpy as np
+
+
+def rolling_mean(values, window):
+    """Trailing mean over each full window, via a cumulative sum instead of a Python loop"""
+    csum = np.cumsum(np.concatenate(([0.0], values)))
+    return (csum[window:] - csum[:-window]) / window
+
+
+def trend_per_day(days, block):
+    """Least-squares slope of every row of block against days, in one matrix product"""
+    centered_days = days - days.mean()
+    denominator = (centered_days ** 2).sum()
+    if denominator == 0:
+        return np.zeros(len(block))
+    return (block - block.mean(axis=1, keepdims=True)) @ centered_days / denominator
+
+
+def summarize(days, block, columns, window=None):
+    """Mean/min/max/total/trend for each column of a (n_columns, n_days) block"""
+    days = days.astype(float)
+    means = block.mean(axis=1)
+    mins = block.min(axis=1)
+    maxs = block.max(axis=1)
+    totals = block.sum(axis=1)
+    trends = trend_per_day(days, block)
+
+    summary = {}
+    for i, col in enumerate(columns):
+        summary[col] = {
+            "mean": round(float(means[i]), 4),
+            "min": float(mins[i]),
+            "max": float(maxs[i]),
+            "total": round(float(totals[i]), 4),
+            "trend_per_day": round(float(trends[i]), 6),
+        }
+        if window:
+            summary[col]["rolling_mean"] = np.round(rolling_mean(block[i], window), 4).tolist()
+    return summary
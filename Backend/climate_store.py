@@ -0,0 +1,236 @@
+"""Multi-location daily climate store, ingested in chunks and read through memory maps.
+
+Each location's POWER-style CSV is streamed in with pandas chunks and appended
+to one raw little-endian file per column (float32 parameters, int32 day
+numbers). Rows for a location are contiguous, so locations.json only records
+each site's coordinates and row range. A (location, date) lookup is a
+searchsorted within that range. Neither ingestion nor lookups ever hold more
+than one chunk or one slice in memory, however many sites and decades are
+stored.
+
+    python climate_store.py ingest nairobi.csv --name Nairobi --lat -1.29 --lon 36.82 --start 2000-01-01
+    python climate_store.py nearest -0.09 34.77
+"""
+import argparse
+import json
+import os
+import re
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from climate_data import ClimateData
+
+STORE_DIR = Path(os.getenv("CLIMATE_STORE_DIR", Path(__file__).with_name("climate_store")))
+DEFAULT_COLUMNS = ("T2M", "T2M_MAX", "T2M_MIN", "PRECTOTCORR", "RH2M", "ALLSKY_SFC_SW_DWN", "GWETPROF", "NDVI_RAW")
+CHUNK_ROWS = 100_000
+POWER_MISSING = -999
+EPOCH = date(1970, 1, 1)
+EARTH_RADIUS_KM = 6371.0
+
+
+def day_number(d):
+    return (d - EPOCH).days
+
+
+def parse_power_header(csv_path):
+    """(rows to skip, lat, lon) from a POWER '-BEGIN HEADER-' block; (0, None, None) without one"""
+    with open(csv_path, encoding="utf-8-sig") as f:
+        first = f.readline()
+        if not first.startswith("-BEGIN HEADER-"):
+            return 0, None, None
+        lat = lon = None
+        for n, line in enumerate(f, start=2):
+            match = re.search(r"Latitude\s+(-?[\d.]+)\s+Longitude\s+(-?[\d.]+)", line)
+            if match:
+                lat, lon = float(match.group(1)), float(match.group(2))
+            if line.startswith("-END HEADER-"):
+                return n, lat, lon
+    raise ValueError(f"{csv_path}: POWER header is never closed")
+
+
+def chunk_day_numbers(chunk, next_day):
+    """Day numbers for a chunk, from YEAR/MO/DY or YEAR/DOY columns, else consecutive from next_day"""
+    if {"YEAR", "MO", "DY"} <= set(chunk.columns):
+        dates = pd.to_datetime(dict(year=chunk["YEAR"], month=chunk["MO"], day=chunk["DY"]))
+    elif {"YEAR", "DOY"} <= set(chunk.columns):
+        dates = pd.to_datetime(chunk["YEAR"].astype(str), format="%Y") + pd.to_timedelta(chunk["DOY"] - 1, unit="D")
+    else:
+        return np.arange(next_day, next_day + len(chunk), dtype="<i4")
+    return ((dates - pd.Timestamp(EPOCH)).dt.days).to_numpy(dtype="<i4")
+
+
+class ClimateStore:
+    def __init__(self, directory=STORE_DIR, columns=DEFAULT_COLUMNS):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.directory / "locations.json"
+        if self.index_path.exists():
+            index = json.loads(self.index_path.read_text())
+            self.columns, self.locations = tuple(index["columns"]), index["locations"]
+        else:
+            self.columns, self.locations = tuple(columns), []
+        self._maps = {}
+        self._coords = None
+
+    @property
+    def n_rows(self):
+        return self.locations[-1]["offset"] + self.locations[-1]["n_days"] if self.locations else 0
+
+    def _path(self, column):
+        return self.directory / f"{column}.{'i4' if column == 'date' else 'f4'}"
+
+    def _write_index(self):
+        tmp = self.index_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps({"columns": list(self.columns), "locations": self.locations}, indent=1))
+        os.replace(tmp, self.index_path)
+        self._maps = {}
+        self._coords = None
+
+    def ingest_csv(self, csv_path, name=None, lat=None, lon=None, start=None, chunk_rows=CHUNK_ROWS):
+        """Append one location's daily CSV; lat/lon default to the POWER header, dates to YEAR/MO/DY or start"""
+        csv_path = Path(csv_path)
+        name = name or csv_path.stem
+        if any(loc["name"] == name for loc in self.locations):
+            raise ValueError(f"location {name!r} is already in the store")
+        skip, header_lat, header_lon = parse_power_header(csv_path)
+        lat = header_lat if lat is None else lat
+        lon = header_lon if lon is None else lon
+        if lat is None or lon is None:
+            raise ValueError(f"{csv_path}: no coordinates in the file; pass lat and lon")
+
+        # Drop anything a crashed ingest appended past the last indexed row
+        offset = self.n_rows
+        for column in ("date",) + self.columns:
+            path = self._path(column)
+            if path.exists():
+                with open(path, "r+b") as f:
+                    f.truncate(offset * 4)
+
+        next_day = day_number(start) if start else None
+        n_days = 0
+        files = {column: open(self._path(column), "ab") for column in ("date",) + self.columns}
+        try:
+            for chunk in pd.read_csv(csv_path, encoding="utf-8-sig", skiprows=skip, chunksize=chunk_rows):
+                if next_day is None and not ({"YEAR", "DOY"} <= set(chunk.columns) or {"YEAR", "MO", "DY"} <= set(chunk.columns)):
+                    raise ValueError(f"{csv_path}: no YEAR/MO/DY or YEAR/DOY columns; pass start")
+                days = chunk_day_numbers(chunk, next_day)
+                if (n_days and days[0] <= last_day) or np.any(np.diff(days) <= 0):
+                    raise ValueError(f"{csv_path}: dates must be strictly increasing")
+                last_day = int(days[-1])
+                next_day = last_day + 1
+                files["date"].write(days.tobytes())
+                for column in self.columns:
+                    values = chunk[column].to_numpy(dtype="<f4") if column in chunk else np.full(len(chunk), np.nan, "<f4")
+                    values[values == POWER_MISSING] = np.nan
+                    files[column].write(values.tobytes())
+                n_days += len(chunk)
+        finally:
+            for f in files.values():
+                f.close()
+
+        first_day = int(np.fromfile(self._path("date"), dtype="<i4", count=1, offset=offset * 4)[0]) if n_days else 0
+        location = {
+            "id": len(self.locations),
+            "name": name,
+            "lat": float(lat),
+            "lon": float(lon),
+            "offset": offset,
+            "n_days": n_days,
+            "first": (EPOCH + timedelta(days=first_day)).isoformat(),
+            "last": (EPOCH + timedelta(days=next_day - 1)).isoformat() if n_days else None,
+        }
+        self.locations.append(location)
+        self._write_index()
+        return location
+
+    def _map(self, column):
+        if column not in self._maps:
+            dtype = "<i4" if column == "date" else "<f4"
+            self._maps[column] = np.memmap(self._path(column), dtype=dtype, mode="r", shape=(self.n_rows,))
+        return self._maps[column]
+
+    def location(self, key):
+        """A location by id or name"""
+        if isinstance(key, int):
+            return self.locations[key]
+        for location in self.locations:
+            if location["name"] == key:
+                return location
+        raise KeyError(key)
+
+    def nearest(self, lat, lon):
+        """(location, distance in km) of the stored site closest to lat/lon"""
+        if not self.locations:
+            raise LookupError("the climate store is empty")
+        if self._coords is None:
+            self._coords = np.radians([[loc["lat"], loc["lon"]] for loc in self.locations])
+        lat1, lon1 = np.radians(lat), np.radians(lon)
+        lat2, lon2 = self._coords[:, 0], self._coords[:, 1]
+        a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+        distances = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+        i = int(np.argmin(distances))
+        return self.locations[i], float(distances[i])
+
+    def _rows(self, location, start=None, end=None):
+        """Row range of location between start and end dates, inclusive"""
+        lo, hi = location["offset"], location["offset"] + location["n_days"]
+        days = self._map("date")[lo:hi]
+        first = np.searchsorted(days, day_number(start)) if start else 0
+        last = np.searchsorted(days, day_number(end), side="right") if end else len(days)
+        return lo + int(first), lo + int(last)
+
+    def series(self, key, column, start=None, end=None):
+        """Memory-mapped slice of one column for a location and date range"""
+        lo, hi = self._rows(self.location(key), start, end)
+        return self._map(column)[lo:hi]
+
+    def lookup(self, key, day):
+        """{column: value} for one location and date, or None if that date isn't stored"""
+        location = self.location(key)
+        lo, hi = self._rows(location, day, day)
+        if hi == lo:
+            return None
+        # str() of a float32 is its shortest repr, so 10.99 comes back as 10.99 rather than 10.989999771
+        return {column: float(str(self._map(column)[lo])) for column in self.columns}
+
+    def lookup_nearest(self, lat, lon, day):
+        """Weather on day at the stored site nearest lat/lon, e.g. an event's location"""
+        location, _ = self.nearest(lat, lon)
+        return self.lookup(location["id"], day)
+
+    def climate_data(self, key, start=None, end=None):
+        """A ClimateData view of one location, for code written against the single-site loader"""
+        lo, hi = self._rows(self.location(key), start, end)
+        values = np.stack([self._map(column)[lo:hi] for column in self.columns])
+        return ClimateData(self.columns, values, "store")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-location climate store")
+    parser.add_argument("--store", default=STORE_DIR, help="store directory")
+    commands = parser.add_subparsers(dest="command", required=True)
+    ingest = commands.add_parser("ingest", help="append a location's daily CSV")
+    ingest.add_argument("csv")
+    ingest.add_argument("--name")
+    ingest.add_argument("--lat", type=float)
+    ingest.add_argument("--lon", type=float)
+    ingest.add_argument("--start", type=date.fromisoformat, help="date of the first row if the CSV has no date columns")
+    nearest = commands.add_parser("nearest", help="closest stored site to a coordinate")
+    nearest.add_argument("lat", type=float)
+    nearest.add_argument("lon", type=float)
+    args = parser.parse_args()
+
+    store = ClimateStore(args.store)
+    if args.command == "ingest":
+        location = store.ingest_csv(args.csv, args.name, args.lat, args.lon, args.start)
+        print(f"{location['name']}: {location['n_days']} days, {location['first']} to {location['last']}")
+    else:
+        location, km = store.nearest(args.lat, args.lon)
+        print(f"{location['name']} ({location['lat']}, {location['lon']}), {km:.1f} km away")
+
+
+if __name__ == "__main__":
+    main()
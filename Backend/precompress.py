@@ -0,0 +1,21 @@
+"""Compress the full /data response at maximum levels ahead of time.
+
+Brotli q11 is ~25% smaller than the level used on request threads but takes
+~100 ms, so it is only run here. Files are named by body digest, so rerun this
+after changing nasa_data.csv and ship the output with the app:
+
+    python precompress.py
+"""
+from app import PRECOMPRESSED_DIR, full_data_entry
+
+
+def main():
+    for path in PRECOMPRESSED_DIR.glob("*"):
+        path.unlink()
+    identity = len(full_data_entry.variants["identity"])
+    for path in full_data_entry.write_precompressed(PRECOMPRESSED_DIR):
+        print(f"{path.name}: {path.stat().st_size:,} bytes (from {identity:,})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+import gzip
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from flask import Response
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+CACHE_MAX_AGE = int(os.getenv("CACHE_MAX_AGE", "3600"))
+MIN_COMPRESS_SIZE = 512
+
+# Variants built on a request thread stay cheap (~2 ms for the full dataset at these levels)
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+# Maximum levels, only for variants compressed ahead of time by write_precompressed()
+OFFLINE_GZIP_LEVEL = 9
+OFFLINE_BROTLI_QUALITY = 11
+PRECOMPRESSED_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def parse_accept_encoding(header):
+    """Return the content codings a client accepts (ignoring q=0 entries)"""
+    accepted = set()
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding and quality > 0:
+            accepted.add(coding)
+    return accepted
+
+
+def parse_if_none_match(header):
+    """Split an If-None-Match header into its entity tags"""
+    return {tag.strip() for tag in (header or "").split(",") if tag.strip()}
+
+
+def compress(body, encoding, offline=False):
+    if encoding == "br":
+        return brotli.compress(body, quality=OFFLINE_BROTLI_QUALITY if offline else BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=OFFLINE_GZIP_LEVEL if offline else GZIP_LEVEL, mtime=0)
+
+
+class CachedResponse:
+    """One serialized body plus its strong ETags; compressed variants are built on first request"""
+
+    def __init__(self, body, mimetype, headers=None):
+        self.mimetype = mimetype
+        self.headers = dict(headers or {})
+        self.digest = hashlib.sha256(body).hexdigest()[:32]
+
+        # Most preferred first; each encoding is a different representation with its own strong ETag
+        self.encodings = ("identity",)
+        if len(body) >= MIN_COMPRESS_SIZE:
+            self.encodings = ("br", "gzip", "identity") if brotli is not None else ("gzip", "identity")
+        suffixes = {"identity": "", "gzip": "-gz", "br": "-br"}
+        self.etags = {enc: f'"{self.digest}{suffixes[enc]}"' for enc in self.encodings}
+        self.variants = {"identity": body}
+        self._lock = threading.Lock()
+
+    def choose_encoding(self, accept_encoding):
+        """Pick the most compact encoding the client can decode"""
+        accepted = parse_accept_encoding(accept_encoding)
+        for enc in self.encodings:
+            if enc == "identity" or enc in accepted or "*" in accepted:
+                return enc
+
+    def variant(self, encoding):
+        """The body in one encoding, compressed once on first use"""
+        body = self.variants.get(encoding)
+        if body is None:
+            with self._lock:
+                body = self.variants.get(encoding)
+                if body is None:
+                    body = compress(self.variants["identity"], encoding)
+                    self.variants[encoding] = body
+        return body
+
+    def _precompressed_path(self, directory, encoding):
+        return Path(directory) / f"{self.digest}{PRECOMPRESSED_SUFFIXES[encoding]}"
+
+    def load_precompressed(self, directory):
+        """Adopt variants write_precompressed() saved for this exact body; files for other bodies are ignored"""
+        for enc in self.encodings[:-1]:  # every encoding but identity
+            path = self._precompressed_path(directory, enc)
+            if path.exists():
+                self.variants[enc] = path.read_bytes()
+
+    def write_precompressed(self, directory):
+        """Compress every variant at the offline levels into directory, named by body digest"""
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        paths = []
+        for enc in self.encodings[:-1]:  # every encoding but identity
+            self.variants[enc] = compress(self.variants["identity"], enc, offline=True)
+            path = self._precompressed_path(directory, enc)
+            path.write_bytes(self.variants[enc])
+            paths.append(path)
+        return paths
+
+    def to_response(self, req):
+        encoding = self.choose_encoding(req.headers.get("Accept-Encoding"))
+        headers = dict(self.headers)
+        headers["ETag"] = self.etags[encoding]
+        headers["Cache-Control"] = f"public, max-age={CACHE_MAX_AGE}"
+        headers["Vary"] = ", ".join(filter(None, [self.headers.get("Vary"), "Accept-Encoding"]))
+
+        # Any variant's tag means the client already holds this content
+        client_tags = parse_if_none_match(req.headers.get("If-None-Match"))
+        if "*" in client_tags or client_tags & set(self.etags.values()):
+            return Response(status=304, headers=headers)
+
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(self.variant(encoding), status=200, headers=headers, mimetype=self.mimetype)
+
+
+class ResponseCache:
+    """LRU of pre-serialized responses, keyed by normalized query shape"""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        # Guards entries; building happens outside it, under a per-key lock so a shape is built once
+        self._lock = threading.Lock()
+        self._building = {}
+
+    def _lookup(self, key):
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def get(self, key, build):
+        """Return the cached entry for key, calling build() -> (body, mimetype, headers) on a miss"""
+        entry = self._lookup(key)
+        if entry is not None:
+            return entry
+
+        with self._lock:
+            key_lock = self._building.setdefault(key, threading.Lock())
+        with key_lock:
+            # Another thread may have built it while we waited
+            entry = self._lookup(key)
+            if entry is not None:
+                return entry
+            try:
+                body, mimetype, headers = build()
+                entry = CachedResponse(body, mimetype, headers)
+                with self._lock:
+                    self.entries[key] = entry
+                    if len(self.entries) > self.max_entries:
+                        self.entries.popitem(last=False)
+            finally:
+                with self._lock:
+                    self._building.pop(key, None)
+        return entry
+
+    def respond(self, key, build, req):
+        return self.get(key, build).to_response(req)
@@ -0,0 +1,78 @@
+import io
+import json
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+JSON_MIMETYPE = "application/json"
+ARROW_MIMETYPE = "application/vnd.apache.arrow.stream"
+NPY_MIMETYPE = "application/x-npy"
+MSGPACK_MIMETYPE = "application/msgpack"
+
+# ?format= names, in the order used to break ties in the Accept header
+FORMAT_MIMETYPES = {
+    "json": JSON_MIMETYPE,
+    "arrow": ARROW_MIMETYPE,
+    "npy": NPY_MIMETYPE,
+    "msgpack": MSGPACK_MIMETYPE,
+}
+
+
+def available_formats():
+    """Formats whose optional dependency is installed"""
+    formats = ["json", "npy"]
+    if pa is not None:
+        formats.append("arrow")
+    if msgpack is not None:
+        formats.append("msgpack")
+    return formats
+
+
+def negotiate_format(req, formats=None):
+    """Pick a format from ?format= or the Accept header, raising ValueError if it can't be served"""
+    formats = formats or available_formats()
+    requested = req.args.get("format")
+    if requested:
+        if requested not in formats:
+            raise ValueError(f"Unsupported format '{requested}', choose from: {', '.join(formats)}")
+        return requested
+
+    mimetypes = [FORMAT_MIMETYPES[f] for f in FORMAT_MIMETYPES if f in formats]
+    best = req.accept_mimetypes.best_match(mimetypes, default=JSON_MIMETYPE)
+    return next(f for f, m in FORMAT_MIMETYPES.items() if m == best)
+
+
+def encode_json(records):
+    return json.dumps(records, separators=(",", ":")).encode("utf-8")
+
+
+def encode_arrow(columns, arrays):
+    """Arrow IPC stream of one record batch; pa.array wraps the NumPy buffers without copying"""
+    batch = pa.RecordBatch.from_arrays([pa.array(arr) for arr in arrays], names=list(columns))
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
+
+
+def encode_npy(arrays):
+    """A (n_columns, n_days) little-endian float32 .npy, one contiguous buffer per column"""
+    stacked = np.empty((len(arrays), len(arrays[0]) if arrays else 0), dtype="<f4")
+    for i, arr in enumerate(arrays):
+        stacked[i] = arr
+    buffer = io.BytesIO()
+    np.save(buffer, stacked, allow_pickle=False)
+    return buffer.getvalue()
+
+
+def encode_msgpack(obj):
+    return msgpack.packb(obj, use_single_float=True)
@@ -0,0 +1,91 @@
+"""Memory and frame time: Crop-object grid with per-cell drawing vs CropField + FieldRenderer,
+redrawing the whole field each frame (draw) or only changed cells (update, dirty rects).
+
+Run from the Game directory (no window needed): python bench_field.py
+"""
+import os
+import random
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from crop_field import CropField
+from field_render import FieldRenderer
+
+SIZES = [(24, 32), (128, 128), (256, 256), (512, 512), (1024, 1024)]
+COLORS = [(151, 76, 1), (126, 134, 74), (188, 219, 90), (147, 193, 0)]
+NDVI_LEVELS = [0, 0.33, 0.66, 1]
+
+
+class Crop:
+    def __init__(self):
+        self.no = 10
+        self.ndvi = 1
+
+
+def object_grid(rows, cols):
+    return [[Crop() for _ in range(cols)] for _ in range(rows)]
+
+
+def object_frame(surface, grid, cell):
+    """The old loop: per-cell color walk and draw.rect, then 25 random degradations"""
+    for h, row in enumerate(grid):
+        for w, crop in enumerate(row):
+            for i in range(len(NDVI_LEVELS)):
+                if crop.ndvi <= NDVI_LEVELS[i]:
+                    color = COLORS[i]
+                    break
+            pygame.draw.rect(surface, color, (w * cell, h * cell, cell, cell))
+    for _ in range(25):
+        x, y = random.randint(0, 10), random.randint(0, 10)
+        grid[y][x].ndvi = max(grid[y][x].ndvi - 0.1, -1)
+
+
+def array_frame(surface, field, renderer, rng, rain):
+    renderer.draw(surface, field.ndvi)
+    field.step(rng, rain)
+
+
+def dirty_frame(surface, field, renderer, rng, rain):
+    renderer.update(surface, field.ndvi)
+    field.step(rng, rain)
+
+
+def timed(fn, frames):
+    fn()
+    start = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    return (time.perf_counter() - start) / frames
+
+
+def main():
+    pygame.init()
+    rng = np.random.default_rng(0)
+    print(f"{'grid':>11} {'objects MB':>11} {'arrays MB':>10} {'objects ms':>11} {'arrays ms':>10} {'dirty ms':>9}")
+    for rows, cols in SIZES:
+        cell = max(1, 800 // cols)
+        surface = pygame.Surface((cols * cell, rows * cell))
+        frames = max(1, 200_000 // (rows * cols))
+
+        tracemalloc.start()
+        grid = object_grid(rows, cols)
+        objects_mb = tracemalloc.get_traced_memory()[0] / 1e6
+        tracemalloc.stop()
+        objects_ms = timed(lambda: object_frame(surface, grid, cell), frames) * 1e3
+        del grid
+
+        field = CropField(rows, cols)
+        renderer = FieldRenderer((rows, cols), cell)
+        arrays_ms = timed(lambda: array_frame(surface, field, renderer, rng, 400), frames) * 1e3
+        dirty_ms = timed(lambda: dirty_frame(surface, field, renderer, rng, 400), frames) * 1e3
+
+        print(f"{rows:>5}x{cols:<5} {objects_mb:>11.2f} {field.nbytes / 1e6:>10.2f} {objects_ms:>11.2f} {arrays_ms:>10.2f} {dirty_ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
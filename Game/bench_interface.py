@@ -0,0 +1,57 @@
+"""Per-frame widget cost as labels and buttons are added: old per-widget render/get_pos vs cached text and shared mouse state.
+
+Run from the Game directory (no window needed): python bench_interface.py
+"""
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import interface
+
+FRAMES = 200
+LABELS = ["Day", "Rain", "NDVI", "Soil moisture", "Harvest", "Water", "Plant", "Next day"]
+
+
+def old_frame(surface, font, buttons, n):
+    # Screens rebuilt their labels every frame, and each label rendered its own text
+    for i in range(n):
+        surface.blit(font.render(LABELS[i % len(LABELS)], True, (0, 0, 0)), (0, i))
+    for button in buttons:
+        position = pygame.mouse.get_pos()
+        surface.blit(button.icon_true if button.rect.collidepoint(position) else button.icon_false, button.position)
+
+
+def new_frame(surface, buttons, n):
+    interface.mouse.update()
+    for i in range(n):
+        interface.Label(text=LABELS[i % len(LABELS)], position=(0, i)).draw(surface)
+    for button in buttons:
+        button.draw(surface)
+
+
+def timed(fn):
+    fn()
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        fn()
+    return (time.perf_counter() - start) / FRAMES * 1e3
+
+
+def main():
+    pygame.init()
+    surface = pygame.display.set_mode((800, 600))
+    font = interface.get_font()
+    icon = pygame.Surface((40, 20))
+    print(f"{'widgets':>8} {'old ms':>8} {'cached ms':>10}")
+    for n in (10, 50, 100, 200):
+        buttons = [interface.Button(icon, icon, (i % 20 * 40, i // 20 * 20)) for i in range(n)]
+        old = timed(lambda: old_frame(surface, font, buttons, n))
+        new = timed(lambda: new_frame(surface, buttons, n))
+        print(f"{2 * n:>8} {old:>8.3f} {new:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
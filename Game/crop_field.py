@@ -0,0 +1,75 @@
+import numpy as np
+
+# NDVI regained per mm of rain each tick, capped at 1
+REGROWTH_PER_MM = 0.00002
+
+# Daily response to the NASA series in step_weather()
+DIFFUSION = 0.2  # share of the gap to the neighbour average closed per day
+RESPONSE = 0.15  # share of the gap to the moisture-adjusted NDVI closed per day
+GWET_REF = 0.64  # typical GWETPROF; wetter soil lifts cells above the observed NDVI
+RAIN_MOISTURE_PER_MM = 0.01
+
+
+class CropField:
+    """Crop grid as contiguous arrays: NDVI (float32) and crop count (int16) per cell"""
+
+    def __init__(self, rows, cols, count=10, ndvi=1.0, soil=None):
+        self.ndvi = np.full((rows, cols), ndvi, dtype=np.float32)
+        self.count = np.full((rows, cols), count, dtype=np.int16)
+        # Per-cell water retention; 1 everywhere unless a soil map is given
+        self.soil = np.ones((rows, cols), dtype=np.float32) if soil is None else np.asarray(soil, dtype=np.float32)
+        self._padded = np.empty((rows + 2, cols + 2), dtype=np.float32)
+        self._scratch = np.empty((2, rows, cols), dtype=np.float32)
+
+    @property
+    def shape(self):
+        return self.ndvi.shape
+
+    @property
+    def nbytes(self):
+        """Everything the field holds, including the step_weather() scratch buffers"""
+        return sum(a.nbytes for a in (self.ndvi, self.count, self.soil, self._padded, self._scratch))
+
+    def degrade(self, rng, cells=25, amount=0.1, region=(11, 11)):
+        """Knock NDVI down in random cells of the top-left region, floored at -1"""
+        ys = rng.integers(0, min(region[0], self.shape[0]), cells)
+        xs = rng.integers(0, min(region[1], self.shape[1]), cells)
+        # subtract.at accumulates repeat hits on the same cell, like the old per-cell loop
+        np.subtract.at(self.ndvi, (ys, xs), amount)
+        np.maximum(self.ndvi, -1, out=self.ndvi)
+
+    def regrow(self, rain_mm):
+        """Rain brings every cell back toward full NDVI"""
+        self.ndvi += np.float32(rain_mm * REGROWTH_PER_MM)
+        np.minimum(self.ndvi, 1, out=self.ndvi)
+
+    def step(self, rng, rain_mm):
+        self.degrade(rng)
+        self.regrow(rain_mm)
+
+    def neighbour_mean(self, out=None):
+        """Average of each cell's four neighbours, with edge cells reusing their own value"""
+        p = self._padded
+        p[1:-1, 1:-1] = self.ndvi
+        p[0, 1:-1], p[-1, 1:-1] = self.ndvi[0], self.ndvi[-1]
+        p[1:-1, 0], p[1:-1, -1] = self.ndvi[:, 0], self.ndvi[:, -1]
+        out = np.add(p[:-2, 1:-1], p[2:, 1:-1], out=out)
+        out += p[1:-1, :-2]
+        out += p[1:-1, 2:]
+        out *= np.float32(0.25)
+        return out
+
+    def step_weather(self, rain_mm, soil_wetness, ndvi_observed):
+        """One day of real weather: neighbour diffusion plus a pull toward the moisture-adjusted observed NDVI.
+
+        ndvi += DIFFUSION * (neighbours - ndvi) + RESPONSE * (soil * moisture * ndvi_observed / GWET_REF - ndvi),
+        evaluated in place in two scratch buffers so a large grid allocates nothing per day.
+        """
+        pull = (soil_wetness + rain_mm * RAIN_MOISTURE_PER_MM) * ndvi_observed / GWET_REF
+        neighbours = self.neighbour_mean(out=self._scratch[0])
+        neighbours *= np.float32(DIFFUSION)
+        target = np.multiply(self.soil, np.float32(RESPONSE * pull), out=self._scratch[1])
+        self.ndvi *= np.float32(1 - DIFFUSION - RESPONSE)
+        self.ndvi += neighbours
+        self.ndvi += target
+        np.clip(self.ndvi, -1, 1, out=self.ndvi)
@@ -0,0 +1,70 @@
+import numpy as np
+import pygame
+
+# NDVI at or below each level gets the matching color
+NDVI_LEVELS = np.array([0, 0.33, 0.66, 1])
+PALETTE = np.array([(151, 76, 1), (126, 134, 74), (188, 219, 90), (147, 193, 0)], dtype=np.uint8)
+PALETTE_COLORS = [tuple(color) for color in PALETTE.tolist()]
+
+# Past this share of changed cells a full re-render beats per-cell fills
+FULL_REDRAW_FRACTION = 0.25
+
+
+def color_index(ndvi):
+    """Palette index per cell: the first level the NDVI doesn't exceed"""
+    return np.minimum(np.digitize(ndvi, NDVI_LEVELS, right=True), len(NDVI_LEVELS) - 1)
+
+
+class FieldRenderer:
+    """Draws an NDVI grid as one blit: palette lookup into a 1px-per-cell surface, scaled up.
+
+    update() keeps the last frame's color buckets and a cached full-size field
+    surface, and only repaints the cells whose bucket changed.
+    """
+
+    def __init__(self, shape, cell_size):
+        self.shape = shape
+        self.cell_size = cell_size
+        self.cells = pygame.Surface((shape[1], shape[0]))
+        self.size = (shape[1] * cell_size, shape[0] * cell_size)
+        self.field = None
+        self.index = None
+
+    def render_index(self, index):
+        rgb = PALETTE[index]
+        # surfarray is indexed (x, y), the grid is (row, col)
+        pygame.surfarray.blit_array(self.cells, rgb.swapaxes(0, 1))
+        return pygame.transform.scale(self.cells, self.size)
+
+    def render(self, ndvi):
+        """Field surface at full size for the given (rows, cols) NDVI grid"""
+        return self.render_index(color_index(ndvi))
+
+    def draw(self, surface, ndvi, position=(0, 0)):
+        surface.blit(self.render(ndvi), position)
+
+    def invalidate(self):
+        """Force the next update() to redraw the whole field"""
+        self.index = None
+
+    def update(self, surface, ndvi, position=(0, 0)):
+        """Repaint cells whose color bucket changed; returns the screen rects to pass to display.update"""
+        index = color_index(ndvi)
+        if self.index is None:
+            changed = None
+        else:
+            ys, xs = np.nonzero(index != self.index)
+            changed = None if len(ys) > FULL_REDRAW_FRACTION * index.size else (ys, xs)
+        self.index = index
+
+        if changed is None:
+            self.field = self.render_index(index)
+            return [surface.blit(self.field, position)]
+
+        size = self.cell_size
+        rects = []
+        for y, x, color in zip(*changed, index[changed].tolist()):
+            cell = pygame.Rect(int(x) * size, int(y) * size, size, size)
+            self.field.fill(PALETTE_COLORS[color], cell)
+            rects.append(surface.blit(self.field, cell.move(position), cell))
+        return rects
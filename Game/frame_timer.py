@@ -0,0 +1,24 @@
+import time
+from collections import deque
+
+
+class FrameTimer:
+    """Rolling average of the time spent per frame (or tick), in milliseconds"""
+
+    def __init__(self, window=60):
+        self.samples = deque(maxlen=window)
+        self.start = None
+
+    def begin(self):
+        self.start = time.perf_counter()
+
+    def end(self):
+        self.samples.append((time.perf_counter() - self.start) * 1e3)
+
+    @property
+    def ms(self):
+        return sum(self.samples) / len(self.samples) if self.samples else 0.0
+
+    @property
+    def max_ms(self):
+        return max(self.samples, default=0.0)
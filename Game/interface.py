@@ -1,11 +1,109 @@
+from collections import OrderedDict
+
 import pygame
 
-pygame.font.init()
+DEFAULT_FONT = ("comicsansms", 15)
+TEXT_CACHE_SIZE = 256
+
+_fonts = {}
+
+
+def get_font(name=DEFAULT_FONT[0], size=DEFAULT_FONT[1]):
+    """SysFont created on first use and shared by every widget asking for it"""
+    key = (name, size)
+    if key not in _fonts:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        _fonts[key] = pygame.font.SysFont(name, size)
+    return _fonts[key]
+
+
+class TextCache:
+    """LRU of rendered text surfaces keyed by (font, text, color)"""
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+
+    def render(self, font, text, color):
+        """font is a (name, size) pair or a pygame Font"""
+        key = (font, text, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+        face = get_font(*font) if isinstance(font, tuple) else font
+        surface = face.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+
+text_cache = TextCache()
+
+
+class MouseState:
+    """Mouse position and buttons, shared by every widget and read from pygame at most once per tick.
+
+    Loops can call update() at the top of each frame; widgets driven without it
+    still refresh on their first read in a new pygame.time tick.
+    """
+
+    def __init__(self):
+        self._position = (0, 0)
+        self._pressed = (False, False, False)
+        self._read_at = None
+
+    def update(self):
+        self._position = pygame.mouse.get_pos()
+        self._pressed = pygame.mouse.get_pressed()
+        self._read_at = pygame.time.get_ticks()
+
+    def _refresh(self):
+        if self._read_at != pygame.time.get_ticks():
+            self.update()
+
+    @property
+    def position(self):
+        self._refresh()
+        return self._position
+
+    @property
+    def pressed(self):
+        self._refresh()
+        return self._pressed
+
+    def over(self, rect):
+        return rect.collidepoint(self.position)
+
+
+mouse = MouseState()
+
 
 class Label:
-    def __init__(self, font=pygame.font.SysFont("comicsansms", 15), text="", position: tuple=(0, 0), color=(0, 0, 0)):
-        self.text = font.render(text, True, color)
+    def __init__(self, font=DEFAULT_FONT, text="", position: tuple=(0, 0), color=(0, 0, 0)):
+        self.font = font
+        self.string = text
         self.position = position
+        self.color = color
+        self._surface = None
+
+    @property
+    def text(self):
+        """Rendered text surface, shared through text_cache"""
+        if self._surface is not None:
+            return self._surface
+        return text_cache.render(self.font, self.string, self.color)
+
+    @text.setter
+    def text(self, value):
+        # A string re-renders through the cache; a surface is used as is, as older screens assign one
+        if isinstance(value, str):
+            self.string, self._surface = value, None
+        else:
+            self._surface = value
+
     def draw(self, surface: pygame.Surface):
         surface.blit(self.text, self.position)
 
@@ -19,18 +117,13 @@ class Button:
         self.rect.y += self.position[1]
 
     def draw(self, surface: pygame.Surface):
-        mouse_position = pygame.mouse.get_pos()
-        if self.rect.collidepoint(mouse_position):
+        if mouse.over(self.rect):
             surface.blit(self.icon_true, self.position)
         else:
             surface.blit(self.icon_false, self.position)
     def execute(self, event: int=None):
-        mouse_position = pygame.mouse.get_pos()
-        if isinstance(event, int): 
-            if self.rect.collidepoint(mouse_position):
+        if isinstance(event, int):
+            if mouse.over(self.rect):
                 pygame.event.post(event)
         else:
-            if self.rect.collidepoint(mouse_position):
-                return True
-            else:
-                return False
\ No newline at end of file
+            return mouse.over(self.rect)
\ No newline at end of file
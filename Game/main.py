@@ -1,34 +1,42 @@
+import argparse
 import asyncio
+import sys
+import time
+from pathlib import Path
+import numpy as np
 import pygame
-import random
 
-class Crop:
-    def __init__(self):
-        self.no = 10
-        self.ndvi = 1
+from crop_field import CropField
+from field_render import FieldRenderer
+from frame_timer import FrameTimer
+from scheduler import FixedStepScheduler
 
-crop_field = []
+FIELD_H, FIELD_W = 24, 32
+WINDOW_W = 800
+TICK_RATE = 5  # simulated days per second
+FPS = 60
 
-for h in range(24):
-    crop_field.append([])
-    for w in range(32):
-        crop_field[h].append(Crop())
-        
-        
-rainfall = []
-for i in range(365):
-    rainfall.append(random.randint(0, 800))
+# The game runs from the Game directory; the shared NASA loader lives in ../Backend
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+try:
+    from Backend.climate_data import get_climate_data
+except ImportError:
+    get_climate_data = None
 
-pygame.init()
-pygame.display.set_mode((800, 600))
-surface = pygame.display.get_surface();
-clock = pygame.time.Clock()
+WEATHER_COLUMNS = ("PRECTOTCORR", "GWETPROF", "NDVI_RAW")
 
-colors = [(151, 76, 1), (126, 134, 74), (188, 219, 90), (147, 193, 0)]
+rng = np.random.default_rng()
 
-ndvi_levels = [0, 0.33, 0.66, 1]
+def load_weather():
+    """(rain mm, soil wetness, NDVI) per day from nasa_data.csv; a flat dry-season stand-in if it isn't bundled"""
+    if get_climate_data is not None:
+        try:
+            return list(get_climate_data().iter_days(*WEATHER_COLUMNS))
+        except OSError:
+            pass
+    return [(0.0, 0.6, 0.4)] * 365
 
-start_image = pygame.image.load("img/start.png")
+weather = load_weather()
 
 rain_img = pygame.surface.Surface((25, 25))
 rain_img.set_colorkey((0, 0, 0))
@@ -40,47 +48,93 @@ pygame.draw.rect(rain_img, (0, 178, 193), (7, 20, 2, 6))
 pygame.draw.rect(rain_img, (0, 178, 193), (15,15, 2, 6))
 pygame.draw.rect(rain_img, (0, 178, 193), (19, 8, 2, 6))
 
-async def main():
+def make_field(rows, cols):
+    """Field starting at the first day's NDVI, with patchy soil so cells respond differently"""
+    soil = rng.uniform(0.7, 1.3, (rows, cols))
+    return CropField(rows, cols, ndvi=weather[0][2], soil=soil)
+
+def simulate_day(crop_field, day):
+    crop_field.step_weather(*weather[day % len(weather)])
+
+def run_headless(crop_field, days):
+    """Simulate days back to back with no display; returns the tick timer"""
+    tick_timer = FrameTimer(window=days)
+    for day in range(days):
+        tick_timer.begin()
+        simulate_day(crop_field, day)
+        tick_timer.end()
+    return tick_timer
+
+async def main(crop_field, tick_rate=TICK_RATE, fps=FPS):
+    rows, cols = crop_field.shape
+    cell_size = max(1, WINDOW_W // cols)
+    
+    pygame.init()
+    pygame.display.set_mode((cols * cell_size, rows * cell_size))
+    surface = pygame.display.get_surface();
+    clock = pygame.time.Clock()
+    
+    field_renderer = FieldRenderer((rows, cols), cell_size)
+    
+    start_image = pygame.image.load("img/start.png")
+    
     is_running = True
+    scheduler = FixedStepScheduler(tick_rate)
+    previous = crop_field.ndvi.copy()
+    
+    surface.fill((255, 255, 255))
 
     while is_running:        
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 is_running = False
+        
+        # Simulation runs at tick_rate however fast frames are drawn
+        for _ in range(scheduler.steps()):
+            previous[:] = crop_field.ndvi
+            scheduler.tick(lambda day: simulate_day(crop_field, day))
                 
-        surface.fill((255, 255, 255))
+        scheduler.frame_timer.begin()
         
         # surface.blit(start_image, (0, 0))
         
-        for h in range(24):
-            for w in range(32):
-                crop: Crop = crop_field[h][w]
-                color = ()
-                for i in range(len(ndvi_levels)):
-                    if crop.ndvi <= ndvi_levels[i]:
-                        color = colors[i]
-                        break
-                    
-                pygame.draw.rect(surface, color, (w*25, h*25, 25, 25))
-                
-                
-        for i in range(25):
-            x = random.randint(0, 10)
-            y = random.randint(0, 10)
-            crop_field[y][x].ndvi -= 0.1
-            if crop_field[y][x].ndvi < -1:
-                crop_field[y][x].ndvi = -1
+        # Draw between the last two ticks; only cells whose color changed are repainted
+        shown = previous + (crop_field.ndvi - previous) * scheduler.alpha
+        dirty = field_renderer.update(surface, shown)
                 
         # for h in range(24):
         #     for w in range(32):
         #         surface.blit(rain_img, (w*25, h*25))
                         
         
-        pygame.display.update()
+        pygame.display.update(dirty)
+        scheduler.frame_timer.end()
+        if len(scheduler.frame_timer.samples) == scheduler.frame_timer.samples.maxlen:
+            pygame.display.set_caption(
+                f"NASA Farm Navigators - day {scheduler.ticks} - "
+                f"tick {scheduler.tick_timer.ms:.2f} ms, frame {scheduler.frame_timer.ms:.2f} ms"
+            )
         await asyncio.sleep(0)  # You must include this statement in your main loop. Keep the argument at 0.
         
-        clock.tick(5)
+        clock.tick(fps)
 
     pygame.quit()
 
-asyncio.run(main())
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="NDVI field prototype")
+    parser.add_argument("--headless", action="store_true", help="simulate without a window, as fast as possible")
+    parser.add_argument("--days", type=int, default=len(weather), help="days to simulate in headless mode")
+    parser.add_argument("--size", type=int, nargs=2, default=(FIELD_H, FIELD_W), metavar=("ROWS", "COLS"))
+    parser.add_argument("--tick-rate", type=float, default=TICK_RATE, help="simulated days per second")
+    parser.add_argument("--fps", type=int, default=FPS)
+    args, _ = parser.parse_known_args()
+
+    crop_field = make_field(*args.size)
+    if args.headless:
+        start = time.perf_counter()
+        tick_timer = run_headless(crop_field, args.days)
+        elapsed = time.perf_counter() - start
+        print(f"{args.days} days on {args.size[0]}x{args.size[1]} in {elapsed * 1e3:.1f} ms "
+              f"(tick mean {tick_timer.ms:.3f} ms, max {tick_timer.max_ms:.3f} ms, {args.days / elapsed:,.0f} days/sec)")
+    else:
+        asyncio.run(main(crop_field, args.tick_rate, args.fps))
@@ -0,0 +1,47 @@
+import time
+
+from frame_timer import FrameTimer
+
+
+class FixedStepScheduler:
+    """Runs the simulation at a fixed tick rate, independent of how fast frames are drawn.
+
+    Each frame, steps() turns the wall time since the last call into whole
+    ticks; the leftover fraction is alpha, for interpolating what's drawn.
+    """
+
+    def __init__(self, tick_rate, max_steps=10):
+        self.dt = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.last = None
+        self.ticks = 0
+        self.tick_timer = FrameTimer()
+        self.frame_timer = FrameTimer()
+
+    def steps(self, now=None):
+        """How many ticks to run this frame"""
+        now = time.perf_counter() if now is None else now
+        if self.last is not None:
+            self.accumulator += now - self.last
+        self.last = now
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            # Too far behind (e.g. window dragged); drop the backlog instead of spiralling
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.dt
+        return steps
+
+    @property
+    def alpha(self):
+        """How far into the next tick we are, 0..1"""
+        return min(self.accumulator / self.dt, 1.0)
+
+    def tick(self, step):
+        """Run one simulation step, timed"""
+        self.tick_timer.begin()
+        step(self.ticks)
+        self.tick_timer.end()
+        self.ticks += 1
@@ -0,0 +1,137 @@
+"""AI advisor requests run on a thread pool, with in-flight dedup and a TTL cache.
+
+ask() returns an AdviceJob straight away. Identical requests made while one
+is still generating share that job, and finished jobs are served from the
+cache until they expire. stream() yields the text as it arrives, so the UI
+can show partial advice instead of blocking behind a spinner.
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+def advice_key(era, day, language, weather, *extra):
+    """Cache key: era, day, language and weather rounded to what the advice can tell apart"""
+    return (era, day, language, round(weather['T2M']), round(weather['PRECTOTCORR'], 1)) + extra
+
+
+class AdviceJob:
+    """Text chunks from one generation, readable while it is still running"""
+
+    def __init__(self):
+        self.chunks = []
+        self.done = False
+        self.error = None
+        self.finished_at = None
+        self._cond = threading.Condition()
+
+    def append(self, chunk):
+        with self._cond:
+            self.chunks.append(chunk)
+            self._cond.notify_all()
+
+    def finish(self, error=None):
+        with self._cond:
+            self.done = True
+            self.error = error
+            self.finished_at = time.monotonic()
+            self._cond.notify_all()
+
+    @property
+    def text(self):
+        return "".join(self.chunks)
+
+    def stream(self, timeout=60):
+        """Yield the accumulated text each time a new chunk arrives"""
+        seen = 0
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._cond:
+                while len(self.chunks) == seen and not self.done:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return
+                    self._cond.wait(remaining)
+                seen = len(self.chunks)
+                text, done = "".join(self.chunks), self.done
+            if text:
+                yield text
+            if done:
+                return
+
+
+class AdvisorService:
+    def __init__(self, model, max_workers=4, ttl=600, max_entries=512):
+        self.model = model
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.cache = OrderedDict()
+        self.in_flight = {}
+        self.lock = threading.Lock()
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="advisor")
+
+    def ask(self, key, prompt):
+        """The job answering prompt: cached, already running, or newly started"""
+        with self.lock:
+            job = self.cache.get(key)
+            if job is not None:
+                if time.monotonic() - job.finished_at < self.ttl:
+                    self.cache.move_to_end(key)
+                    return job
+                del self.cache[key]
+
+            job = self.in_flight.get(key)
+            if job is not None:
+                return job
+
+            job = AdviceJob()
+            self.in_flight[key] = job
+        self.pool.submit(self._generate, key, prompt, job)
+        return job
+
+    def _generate(self, key, prompt, job):
+        try:
+            try:
+                response = self.model.generate_content(prompt, stream=True)
+            except TypeError:
+                # Models without streaming support answer in one piece
+                response = [self.model.generate_content(prompt)]
+            for chunk in response:
+                job.append(chunk.text)
+            job.finish()
+        except Exception as e:
+            job.finish(error=e)
+
+        with self.lock:
+            self.in_flight.pop(key, None)
+            if job.error is None:
+                self.cache[key] = job
+                if len(self.cache) > self.max_entries:
+                    self.cache.popitem(last=False)
+
+
+class FakeAdvisorModel:
+    """Offline stand-in for the Gemini model that streams a canned answer word by word"""
+
+    class Chunk:
+        def __init__(self, text):
+            self.text = text
+
+    def __init__(self, latency=0.0, answer="🌱 Mulch your beds to hold moisture. 💧 Water early while it is cool."):
+        self.latency = latency
+        self.answer = answer
+        self.calls = 0
+
+    def generate_content(self, prompt, stream=False):
+        self.calls += 1
+        words = [word + " " for word in self.answer.split(" ")]
+        if not stream:
+            time.sleep(self.latency)
+            return self.Chunk("".join(words).strip())
+        return self._stream(words)
+
+    def _stream(self, words):
+        for word in words:
+            time.sleep(self.latency / len(words))
+            yield self.Chunk(word)
@@ -7,8 +7,20 @@ import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, timedelta
 import random
-import json
+import re
 from pathlib import Path
+from types import MappingProxyType
+
+from Backend.climate_data import ERA_DAY_RANGES, get_climate_data
+from farm_engine import DayEngine
+import farm_rules
+from farm_rules import CROP_TYPES
+from save_system import SaveWriter, open_save_backend
+from i18n_catalog import load_catalog
+from translation import Translator
+from advisor import AdvisorService, advice_key
+from event_scheduler import EventScheduler
+from rerun_profiler import PROFILER, profiled
 
 # Page config
 st.set_page_config(
@@ -29,30 +41,22 @@ if GEMINI_API_KEY:
 else:
     model = None
 
-# Translation cache
-TRANSLATION_CACHE = {}
+# Translation: compiled catalog for static text, then LRU + on-disk store with per-screen batches for the rest
+@st.cache_resource
+def get_translator():
+    return Translator(model, catalog=load_catalog())
 
-def translate_text(text, target_lang='Kiswahili'):
-    """Translate text using Gemini API with caching"""
-    if target_lang == 'English' or not model:
-        return text
-    
-    cache_key = f"{text}_{target_lang}"
-    if cache_key in TRANSLATION_CACHE:
-        return TRANSLATION_CACHE[cache_key]
-    
-    try:
-        prompt = f"Translate this to {target_lang}, keeping emojis: {text}"
-        response = model.generate_content(prompt)
-        translated = response.text.strip()
-        TRANSLATION_CACHE[cache_key] = translated
-        return translated
-    except:
-        return text
+# AI advisor: generation runs on a thread pool; identical requests share one job and answers are cached
+@st.cache_resource
+def get_advisor():
+    return AdvisorService(model)
 
 def t(text):
     """Quick translation wrapper"""
-    return translate_text(text, st.session_state.get('language', 'English'))
+    st.session_state.setdefault('screen_strings', set()).add(text)
+    translated = get_translator().lookup(text, st.session_state.get('language', 'English'))
+    # Misses render in English this run; main() batch-translates them and reruns once
+    return text if translated is None else translated
 
 # Save system
 SAVES_DIR = Path("saves")
@@ -67,7 +71,7 @@ ERAS = {
         "description": "The dawn of independence and agricultural modernization",
         "years": "1960-1969",
         "total_events": 4,
-        "data_range": (0, 73),
+        "data_range": ERA_DAY_RANGES["1960s"],
         "unlocked": True,
         "challenges": [
             "Experience Kenya's independence",
@@ -83,7 +87,7 @@ ERAS = {
         "description": "New technologies transform Kenyan farms",
         "years": "1980-1989",
         "total_events": 4,
-        "data_range": (74, 146),
+        "data_range": ERA_DAY_RANGES["1980s"],
         "unlocked": False,
         "challenges": [
             "Survive the coffee crisis",
@@ -99,7 +103,7 @@ ERAS = {
         "description": "Technology meets traditional farming",
         "years": "2000-2009",
         "total_events": 4,
-        "data_range": (147, 219),
+        "data_range": ERA_DAY_RANGES["2000s"],
         "unlocked": False,
         "challenges": [
             "Navigate post-election period",
@@ -115,7 +119,7 @@ ERAS = {
         "description": "IoT sensors and precision agriculture",
         "years": "2010-2019",
         "total_events": 4,
-        "data_range": (220, 292),
+        "data_range": ERA_DAY_RANGES["2010s"],
         "unlocked": False,
         "challenges": [
             "Benefit from devolution",
@@ -131,7 +135,7 @@ ERAS = {
         "description": "Fighting climate change through smart farming",
         "years": "2020-2025",
         "total_events": 4,
-        "data_range": (293, 366),
+        "data_range": ERA_DAY_RANGES["2020s"],
         "unlocked": False,
         "challenges": [
             "Survive COVID-19 pandemic",
@@ -376,14 +380,8 @@ HISTORICAL_EVENTS = {
     ]
 }
 
-# Crop types
-CROP_TYPES = {
-    "maize": {"name": "Maize", "emoji": "🌽", "days": 15, "value": 50},
-    "beans": {"name": "Beans", "emoji": "🫘", "days": 12, "value": 40},
-    "coffee": {"name": "Coffee", "emoji": "☕", "days": 30, "value": 150},
-    "sukuma": {"name": "Sukuma Wiki", "emoji": "🥬", "days": 8, "value": 30},
-    "tomatoes": {"name": "Tomatoes", "emoji": "🍅", "days": 18, "value": 60},
-}
+# Indexed by (era, day) once at import; triggered events are tracked by id
+EVENT_SCHEDULER = EventScheduler(HISTORICAL_EVENTS)
 
 # Avatar options
 AVATAR_OPTIONS = {
@@ -396,10 +394,9 @@ AVATAR_OPTIONS = {
 MAX_ENERGY = 100
 
 # Custom CSS with Afrocentric pixel art theme
-def get_theme_css():
-    is_dark = st.session_state.get('dark_mode', False)
-    
-    if is_dark:
+def theme_css_source(theme):
+    """Unminified <style> block for 'light' or 'dark'"""
+    if theme == 'dark':
         # Dark Mode - Inspired by African night skies
         return """
         <style>
@@ -685,17 +682,42 @@ def get_theme_css():
         </style>
         """
 
-# NASA data loading
-@st.cache_data
+def minify_css(css):
+    """Collapse whitespace so fewer bytes go over the websocket on each rerun"""
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};,>])\s*", r"\1", css).strip()
+
+# Built once per theme at import; reruns only pick the string for the current mode
+THEME_CSS = MappingProxyType({theme: minify_css(theme_css_source(theme)) for theme in ('light', 'dark')})
+
+def get_theme_css():
+    return THEME_CSS['dark' if st.session_state.get('dark_mode', False) else 'light']
+
+# NASA data loading (shared, parsed-once dataset from Backend/climate_data.py)
+@st.cache_resource
 def load_nasa_data():
     try:
-        df = pd.read_csv('nasa_data.csv')
-        df['day'] = range(len(df))
-        return df
+        return get_climate_data().frame()
     except Exception as e:
         st.error(f"NASA data not found: {e}")
         return None
 
+@st.cache_resource
+def get_day_engine():
+    return DayEngine()
+
+# Farm grid and market rerun on their own (st.fragment, Streamlit 1.37+); FULL_RERUNS=1 restores whole-script reruns
+USE_FRAGMENTS = hasattr(st, 'fragment') and not os.getenv('FULL_RERUNS')
+fragment = st.fragment if USE_FRAGMENTS else (lambda fn: fn)
+if PROFILER:
+    PROFILER.mode = 'fragments' if USE_FRAGMENTS else 'full'
+
+def rerun_unit():
+    """Rerun only the calling fragment, or the whole script when fragments are off"""
+    if USE_FRAGMENTS:
+        st.rerun(scope="fragment")
+    st.rerun()
+
 # Initialize session state
 def init_session_state():
     if 'initialized' not in st.session_state:
@@ -714,6 +736,7 @@ def init_session_state():
         st.session_state.fertilizer = 20
         st.session_state.farm_plots = []
         st.session_state.active_events = []
+        st.session_state.triggered_events = set()
         st.session_state.current_era = None
         st.session_state.day = 0
         st.session_state.era_day = 0
@@ -725,6 +748,12 @@ def init_session_state():
             for era in ERAS.keys()
         }
 
+@st.cache_resource
+def get_save_writer():
+    # SAVE_BACKEND=sqlite keeps every player in saves/shambabyte.db instead of one file each
+    backend = open_save_backend(os.getenv('SAVE_BACKEND', 'json'), SAVES_DIR, os.getenv('SAVE_ENCODING', 'json'))
+    return SaveWriter(backend)
+
 def save_game():
     """Save game state"""
     if not st.session_state.get('player_name'):
@@ -750,58 +779,64 @@ def save_game():
         'completed_challenges': st.session_state.completed_challenges
     }
     
-    try:
-        safe_name = "".join(c for c in st.session_state.player_name if c.isalnum()).lower()
-        save_file = SAVES_DIR / f"{safe_name}_save.json"
-        with open(save_file, 'w') as f:
-            json.dump(save_data, f, indent=2)
-        return True
-    except Exception as e:
-        st.error(f"Save failed: {e}")
+    # Queued for the background writer, which coalesces rapid clicks into one small journal write
+    writer = get_save_writer()
+    writer.submit(st.session_state.player_name, save_data)
+    error = writer.take_error(st.session_state.player_name)
+    if error:
+        st.error(f"Save failed: {error}")
         return False
+    return True
 
-def create_event_map(events):
-    """Create interactive map with event locations"""
-    fig = go.Figure()
-    
-    # Your farm location (Nairobi area)
-    fig.add_trace(go.Scattermapbox(
-        lat=[-1.2921],
-        lon=[36.8219],
+FARM_LOCATION = {"lat": -1.2921, "lon": 36.8219}
+EVENT_COLORS = {"disaster": "red", "economic": "blue"}
+
+def build_event_map():
+    """Map with one trace holding every point; starts with just the farm marker"""
+    fig = go.Figure(go.Scattermapbox(
+        lat=[FARM_LOCATION['lat']],
+        lon=[FARM_LOCATION['lon']],
         mode='markers+text',
-        marker=dict(size=20, color='green'),
+        marker=dict(size=[20], color=['green']),
         text=['🏠 Your Farm'],
+        hovertext=['Your Farm'],
+        hoverinfo='text',
         textposition='top center',
-        name='Your Farm'
+        name='Events'
     ))
     
-    # Event locations
-    for event in events:
-        loc = event['location']
-        color = 'red' if event['type'] == 'disaster' else 'blue' if event['type'] == 'economic' else 'purple'
-        
-        fig.add_trace(go.Scattermapbox(
-            lat=[loc['lat']],
-            lon=[loc['lon']],
-            mode='markers+text',
-            marker=dict(size=15, color=color),
-            text=[f"{event['emoji']} {event['name']}"],
-            textposition='top center',
-            name=event['name'],
-            hovertext=f"{event['name']}<br>{event['description']}"
-        ))
-    
     fig.update_layout(
         mapbox=dict(
             style='open-street-map',
-            center=dict(lat=-1.2921, lon=36.8219),
+            center=dict(lat=FARM_LOCATION['lat'], lon=FARM_LOCATION['lon']),
             zoom=5.5
         ),
         height=500,
         margin=dict(l=0, r=0, t=0, b=0),
         showlegend=False
     )
-    
+    return fig
+
+def add_event_points(fig, events):
+    """Append one point per event to the map's single trace"""
+    trace = fig.data[0]
+    with fig.batch_update():
+        trace.lat = tuple(trace.lat) + tuple(event['location']['lat'] for event in events)
+        trace.lon = tuple(trace.lon) + tuple(event['location']['lon'] for event in events)
+        trace.marker.size = tuple(trace.marker.size) + (15,) * len(events)
+        trace.marker.color = tuple(trace.marker.color) + tuple(EVENT_COLORS.get(event['type'], 'purple') for event in events)
+        trace.text = tuple(trace.text) + tuple(f"{event['emoji']} {event['name']}" for event in events)
+        trace.hovertext = tuple(trace.hovertext) + tuple(f"{event['name']}<br>{event['description']}" for event in events)
+
+def create_event_map(events):
+    """Event map, memoized per session on the event names and extended in place as events trigger"""
+    names = tuple(event['name'] for event in events)
+    cached_names, fig = st.session_state.get('event_map', ((), None))
+    if fig is None or names[:len(cached_names)] != cached_names:
+        cached_names, fig = (), build_event_map()
+    if names != cached_names:
+        add_event_points(fig, events[len(cached_names):])
+        st.session_state.event_map = (names, fig)
     return fig
 
 def render_welcome():
@@ -878,10 +913,7 @@ def render_avatar_creator():
             'farm_name': farmer_name or "Shamba Ya Amani"
         }
         # Initialize 4 farm plots instead of 9
-        st.session_state.farm_plots = [
-            {"crop": None, "planted_day": 0, "health": 100, "watered": False}
-            for _ in range(4)
-        ]
+        st.session_state.farm_plots = [farm_rules.new_plot() for _ in range(farm_rules.N_PLOTS)]
         st.session_state.current_screen = 'era_selection'
         save_game()
         st.rerun()
@@ -934,13 +966,10 @@ def render_era_selection():
                 if st.button(f"▶️ {t('PLAY')}", key=f"play_{era_key}", use_container_width=True, type="primary"):
                     st.session_state.current_era = era_key
                     st.session_state.current_screen = 'gameplay'
-                    # Set era-specific day range
-                    start_day, end_day = era['data_range']
-                    st.session_state.day = start_day
-                    st.session_state.era_start_day = start_day
-                    st.session_state.era_end_day = end_day
-                    st.session_state.era_day = 0
+                    farm_rules.enter_era(st.session_state, era_key)
                     st.session_state.active_events = []
+                    st.session_state.triggered_events = set()
+                    st.session_state.events_checked_day = -1
                     save_game()
                     st.rerun()
         
@@ -952,20 +981,103 @@ def render_era_selection():
                     st.markdown(f"{status} {t(challenge)}")
 
 def check_for_events():
-    """Check if any events trigger today"""
+    """Check if any events trigger today, including days skipped by a multi-day advance"""
     era = st.session_state.current_era
     current_day = st.session_state.era_day
+    triggered = st.session_state.setdefault('triggered_events', set())
     
-    if era not in HISTORICAL_EVENTS:
-        return []
+    last_checked = st.session_state.get('events_checked_day', -1)
+    if last_checked >= current_day:
+        last_checked = current_day - 1
+    st.session_state.events_checked_day = current_day
     
-    triggered = []
-    for event in HISTORICAL_EVENTS[era]:
-        if event['day'] == current_day:
-            if event not in st.session_state.active_events:
-                triggered.append(event)
+    return EVENT_SCHEDULER.fire(era, last_checked + 1, current_day, triggered)
+
+@fragment
+@profiled("farm")
+def render_farm_plots():
+    """Farm grid; watering and planting rerun only this fragment"""
+    st.markdown(f"### {t('Your Farm')}")
+    st.caption(f"🌱 {t('Seeds')}: {st.session_state.seeds} · 💧 {t('Water')}: {st.session_state.water}L")
     
-    return triggered
+    # 2x2 grid for 4 plots
+    cols = st.columns(2)
+    for i, plot in enumerate(st.session_state.farm_plots):
+        with cols[i % 2]:
+            if plot['crop']:
+                crop = CROP_TYPES[plot['crop']]
+                growth = farm_rules.growth(st.session_state, plot)
+                
+                st.markdown(f"""
+                <div class='crop-plot african-pattern'>
+                    <div style='font-size: 3.5rem;'>{crop['emoji']}</div>
+                    <strong style='font-size: 1.1rem;'>{t(crop['name'])}</strong><br>
+                    <small>{t('Growth')}: {growth:.0f}%</small><br>
+                    <small>{t('Health')}: {plot['health']}%</small>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                if growth >= 100:
+                    if st.button(t("🌾 Harvest"), key=f"h{i}", use_container_width=True):
+                        harvest_value = farm_rules.harvest(st.session_state, i)
+                        st.success(f"{t('Harvested!')} +KSh{harvest_value}")
+                        save_game()
+                        # Money shows in the header, so a harvest redraws the whole screen
+                        st.rerun()
+                else:
+                    if st.button(t("💧 Water"), key=f"w{i}", use_container_width=True):
+                        if farm_rules.water_plot(st.session_state, i):
+                            st.success(t("Watered!"))
+                            save_game()
+                            rerun_unit()
+            else:
+                st.markdown(f"""
+                <div class='crop-plot african-pattern'>
+                    <div style='font-size: 3.5rem;'>🟫</div>
+                    <small>{t('Empty Plot')}</small>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                selected = st.selectbox(
+                    t("Crop"),
+                    list(CROP_TYPES.keys()),
+                    key=f"s{i}",
+                    format_func=lambda x: f"{CROP_TYPES[x]['emoji']} {t(CROP_TYPES[x]['name'])}"
+                )
+                
+                if st.button(t("🌱 Plant"), key=f"p{i}", use_container_width=True):
+                    if farm_rules.plant(st.session_state, i, selected):
+                        st.success(t("Planted!"))
+                        save_game()
+                        rerun_unit()
+
+@fragment
+@profiled("market")
+def render_market():
+    """Market; purchases rerun only this fragment"""
+    st.markdown(f"### {t('🏪 Market')}")
+    # Live balance here; the header metric catches up on the next full rerun
+    st.caption(f"💰 KSh {st.session_state.money:,} · 🌱 {t('Seeds')}: {st.session_state.seeds} · 💧 {t('Water')}: {st.session_state.water}L")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(f"#### {t('Buy Seeds')}")
+        for crop_id, crop in CROP_TYPES.items():
+            price = farm_rules.seed_price(crop_id)
+            if st.button(f"{crop['emoji']} {t(crop['name'])} - KSh{price}", key=f"buy_{crop_id}"):
+                if farm_rules.buy_seeds(st.session_state, crop_id):
+                    st.success(f"{t('Bought')} {farm_rules.SEED_PACK} {t('seeds')}!")
+                    save_game()
+                    rerun_unit()
+    
+    with col2:
+        st.markdown(f"#### {t('Buy Supplies')}")
+        
+        if st.button(t("💧 Water (20L) - KSh50")):
+            if farm_rules.buy_water(st.session_state):
+                save_game()
+                rerun_unit()
 
 def render_gameplay():
     """Main gameplay screen with map"""
@@ -973,6 +1085,7 @@ def render_gameplay():
     if nasa_data is None:
         st.error("NASA data failed to load. Please check nasa_data.csv exists.")
         return
+    day_engine = get_day_engine()
     
     # Check for events
     new_events = check_for_events()
@@ -1051,93 +1164,10 @@ def render_gameplay():
     tab1, tab2, tab3 = st.tabs([t("🌾 Farm"), t("🏪 Market"), t("📊 Progress")])
     
     with tab1:
-        st.markdown(f"### {t('Your Farm')}")
-        
-        # 2x2 grid for 4 plots
-        cols = st.columns(2)
-        for i, plot in enumerate(st.session_state.farm_plots):
-            with cols[i % 2]:
-                if plot['crop']:
-                    crop = CROP_TYPES[plot['crop']]
-                    days_growing = st.session_state.day - plot['planted_day']
-                    growth = min(100, (days_growing / crop['days']) * 100)
-                    
-                    st.markdown(f"""
-                    <div class='crop-plot african-pattern'>
-                        <div style='font-size: 3.5rem;'>{crop['emoji']}</div>
-                        <strong style='font-size: 1.1rem;'>{t(crop['name'])}</strong><br>
-                        <small>{t('Growth')}: {growth:.0f}%</small><br>
-                        <small>{t('Health')}: {plot['health']}%</small>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    if growth >= 100:
-                        if st.button(t("🌾 Harvest"), key=f"h{i}", use_container_width=True):
-                            harvest_value = int(crop['value'] * (plot['health']/100))
-                            st.session_state.money += harvest_value
-                            st.session_state.xp += 25
-                            plot['crop'] = None
-                            st.success(f"{t('Harvested!')} +KSh{harvest_value}")
-                            save_game()
-                            st.rerun()
-                    else:
-                        if st.button(t("💧 Water"), key=f"w{i}", use_container_width=True):
-                            if st.session_state.water >= 5:
-                                st.session_state.water -= 5
-                                plot['health'] = min(100, plot['health'] + 10)
-                                st.success(t("Watered!"))
-                                save_game()
-                                st.rerun()
-                else:
-                    st.markdown(f"""
-                    <div class='crop-plot african-pattern'>
-                        <div style='font-size: 3.5rem;'>🟫</div>
-                        <small>{t('Empty Plot')}</small>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    selected = st.selectbox(
-                        t("Crop"),
-                        list(CROP_TYPES.keys()),
-                        key=f"s{i}",
-                        format_func=lambda x: f"{CROP_TYPES[x]['emoji']} {t(CROP_TYPES[x]['name'])}"
-                    )
-                    
-                    if st.button(t("🌱 Plant"), key=f"p{i}", use_container_width=True):
-                        if st.session_state.seeds >= 1:
-                            st.session_state.seeds -= 1
-                            plot['crop'] = selected
-                            plot['planted_day'] = st.session_state.day
-                            st.success(t("Planted!"))
-                            save_game()
-                            st.rerun()
+        render_farm_plots()
     
     with tab2:
-        st.markdown(f"### {t('🏪 Market')}")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown(f"#### {t('Buy Seeds')}")
-            for crop_id, crop in CROP_TYPES.items():
-                price = crop['value'] // 3
-                if st.button(f"{crop['emoji']} {t(crop['name'])} - KSh{price}", key=f"buy_{crop_id}"):
-                    if st.session_state.money >= price:
-                        st.session_state.money -= price
-                        st.session_state.seeds += 5
-                        st.success(f"{t('Bought')} 5 {t('seeds')}!")
-                        save_game()
-                        st.rerun()
-        
-        with col2:
-            st.markdown(f"#### {t('Buy Supplies')}")
-            
-            if st.button(t("💧 Water (20L) - KSh50")):
-                if st.session_state.money >= 50:
-                    st.session_state.money -= 50
-                    st.session_state.water += 20
-                    save_game()
-                    st.rerun()
+        render_market()
     
     with tab3:
         st.markdown(f"### {t('📊 Your Progress')}")
@@ -1165,57 +1195,48 @@ def render_gameplay():
         ai_label = t("🤖 AI Advisor") if model else t("🤖 AI (Disabled)")
         if st.button(ai_label, use_container_width=True, disabled=not model):
             if model:
-                with st.spinner(t("Analyzing...")):
-                    weather = nasa_data.iloc[st.session_state.day]
-                    prompt = f"""You're advising a Kenyan farmer in {era['name']}. 
-                    Weather: Temp {weather['T2M']:.1f}°C, Rain {weather['PRECTOTCORR']:.2f}mm
-                    Give advice in {st.session_state.language} with emojis. 2 sentences."""
-                    
-                    response = model.generate_content(prompt)
-                    st.info(response.text)
+                weather = day_engine.weather(st.session_state.day)
+                prompt = f"""You're advising a Kenyan farmer in {era['name']}. 
+                Weather: Temp {weather['T2M']:.1f}°C, Rain {weather['PRECTOTCORR']:.2f}mm
+                Give advice in {st.session_state.language} with emojis. 2 sentences."""
+                
+                key = advice_key(st.session_state.current_era, st.session_state.day, st.session_state.language, weather)
+                job = get_advisor().ask(key, prompt)
+                advice_box = st.empty()
+                advice_box.info(t("Analyzing..."))
+                for partial in job.stream():
+                    advice_box.info(partial)
+                if job.error is not None:
+                    advice_box.warning(t("AI advisor is unavailable right now, try again in a moment"))
             else:
                 st.warning(t("Set GEMINI_API_KEY environment variable to enable AI advisor"))
     
     with col3:
         if st.button(t("⏭️ Next Day"), use_container_width=True, type="primary"):
-            st.session_state.day += 1
-            st.session_state.era_day += 1
             st.session_state.energy = MAX_ENERGY
+            era_complete = farm_rules.next_day(st.session_state, day_engine)
             
-            # Check if era complete
-            if st.session_state.day >= st.session_state.era_end_day:
-                st.session_state.era_progress[st.session_state.current_era]['completed'] = True
-                # Unlock next era
-                era_keys = list(ERAS.keys())
-                current_idx = era_keys.index(st.session_state.current_era)
-                if current_idx < len(era_keys) - 1:
-                    next_era = era_keys[current_idx + 1]
-                    st.session_state.era_progress[next_era]['unlocked'] = True
-                
+            # Era completed and next era unlocked by farm_rules
+            if era_complete:
                 st.balloons()
                 st.success(f"{t('Era Complete!')} {era['name']} 🎉")
                 st.session_state.current_screen = 'era_selection'
                 save_game()
                 st.rerun()
             
-            # Weather effects
-            if st.session_state.day < len(nasa_data):
-                weather = nasa_data.iloc[st.session_state.day]
-                rain_water = int(weather['PRECTOTCORR'] * 3)
-                st.session_state.water = min(100, st.session_state.water + rain_water)
-            
-            # Update crops
-            for plot in st.session_state.farm_plots:
-                if plot['crop'] and not plot['watered']:
-                    plot['health'] -= 5
-                plot['watered'] = False
-            
             save_game()
             st.rerun()
 
+@profiled("script")
 def main():
     init_session_state()
     
+    # Prefetch every string this screen is known to use in a single request
+    translator = get_translator()
+    screen = st.session_state.current_screen
+    translator.prefetch(translator.screen_texts(screen), st.session_state.language)
+    st.session_state.screen_strings = set()
+    
     # Apply theme CSS
     st.markdown(get_theme_css(), unsafe_allow_html=True)
     
@@ -1230,6 +1251,15 @@ def main():
         render_gameplay()
     else:
         st.error(f"Unknown screen: {st.session_state.current_screen}")
+    
+    # Strings seen for the first time went out in English; translate them together and redraw
+    translator.remember_screen(screen, st.session_state.screen_strings)
+    if translator.prefetch(st.session_state.screen_strings, st.session_state.language):
+        st.rerun()
+    
+    if PROFILER:
+        with st.sidebar.expander("⏱️ Reruns"):
+            st.table(pd.DataFrame(PROFILER.summary(), columns=["mode", "unit", "runs", "mean ms"]))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,5 +1,4 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
 import google.generativeai as genai
 import os
@@ -8,6 +7,11 @@ import plotly.express as px
 from datetime import datetime, timedelta
 import random
 
+from Backend.climate_data import ERA_DAY_RANGES, get_climate_data
+from farm_engine import DayEngine
+from hazards import FORECAST_HORIZON, HazardTable
+from advisor import AdvisorService, advice_key
+
 # Page config
 st.set_page_config(
     page_title="Shambabyte - Farm Through History 🌾",
@@ -226,7 +230,8 @@ DISASTERS = {
     "heatwave": {"emoji": "🔥", "color": "#FF0000", "severity": "medium"},
     "frost": {"emoji": "❄️", "color": "#00FFFF", "severity": "medium"},
     "locust": {"emoji": "🦗", "color": "#8B4513", "severity": "critical"},
-    "windstorm": {"emoji": "🌪️", "color": "#808080", "severity": "medium"}
+    "windstorm": {"emoji": "🌪️", "color": "#808080", "severity": "medium"},
+    "dry_spell": {"emoji": "🌵", "color": "#D2691E", "severity": "medium"}
 }
 
 # Skills System
@@ -250,7 +255,7 @@ ERAS = {
         "description": "The dawn of independence and agricultural modernization",
         "years": "1960-1969",
         "total_events": 8,
-        "data_range": (0, 73),
+        "data_range": ERA_DAY_RANGES["1960s"],
         "unlocked": True,
         "disasters": ["drought", "locust"],
         "historical_context": "Post-independence Kenya focuses on food security and land reform"
@@ -262,7 +267,7 @@ ERAS = {
         "description": "New technologies transform Kenyan farms",
         "years": "1980-1989",
         "total_events": 10,
-        "data_range": (74, 146),
+        "data_range": ERA_DAY_RANGES["1980s"],
         "unlocked": False,
         "disasters": ["drought", "flood", "locust"],
         "historical_context": "Introduction of high-yield varieties and mechanization"
@@ -274,7 +279,7 @@ ERAS = {
         "description": "Technology meets traditional farming",
         "years": "2000-2009",
         "total_events": 12,
-        "data_range": (147, 219),
+        "data_range": ERA_DAY_RANGES["2000s"],
         "unlocked": False,
         "disasters": ["drought", "flood", "heatwave"],
         "historical_context": "Mobile money, GPS, and satellite data revolutionize farming"
@@ -286,7 +291,7 @@ ERAS = {
         "description": "Smartphones, data analytics, and precision agriculture",
         "years": "2010-2019",
         "total_events": 14,
-        "data_range": (220, 292),
+        "data_range": ERA_DAY_RANGES["2010s"],
         "unlocked": False,
         "disasters": ["drought", "flood", "heatwave", "windstorm"],
         "historical_context": "Big data, IoT sensors, and AI predictions transform agriculture"
@@ -298,7 +303,7 @@ ERAS = {
         "description": "Fighting climate change through smart farming",
         "years": "2020-2025",
         "total_events": 10,
-        "data_range": (293, 366),
+        "data_range": ERA_DAY_RANGES["2020s"],
         "unlocked": False,
         "disasters": ["drought", "flood", "heatwave", "frost", "windstorm"],
         "historical_context": "Climate-smart agriculture and sustainable practices lead the way"
@@ -306,16 +311,22 @@ ERAS = {
 }
 
 # Load NASA data
-@st.cache_data
+@st.cache_resource
 def load_nasa_data():
     try:
-        df = pd.read_csv('nasa_data.csv')
-        df['day'] = range(len(df))
-        return df
+        return get_climate_data().frame()
     except:
         st.error("⚠️ NASA data file not found!")
         return None
 
+@st.cache_resource
+def get_day_engine():
+    return DayEngine(rain_factor=5)
+
+@st.cache_resource
+def get_hazard_table():
+    return HazardTable()
+
 # Initialize session state
 def init_session_state():
     if 'initialized' not in st.session_state:
@@ -354,50 +365,7 @@ def init_session_state():
 
 def predict_disasters(nasa_data, current_day, era):
     """Predict upcoming disasters based on weather patterns"""
-    disasters = []
-    
-    # Look ahead 7 days
-    for i in range(1, 8):
-        if current_day + i >= len(nasa_data):
-            break
-            
-        weather = nasa_data.iloc[current_day + i]
-        
-        # Drought detection
-        if weather['PRECTOTCORR'] < 0.5 and weather['GWETPROF'] < 0.3:
-            disasters.append({
-                "type": "drought",
-                "day": i,
-                "severity": "high" if weather['GWETPROF'] < 0.2 else "medium",
-                "message": f"🏜️ Drought warning! Day +{i}: Very low rainfall expected ({weather['PRECTOTCORR']:.2f}mm)"
-            })
-        
-        # Flood detection
-        if weather['PRECTOTCORR'] > 20:
-            disasters.append({
-                "type": "flood",
-                "day": i,
-                "severity": "high",
-                "message": f"🌊 Flood alert! Day +{i}: Heavy rainfall incoming ({weather['PRECTOTCORR']:.1f}mm)"
-            })
-        
-        # Heatwave detection
-        if weather['T2M_MAX'] > 35:
-            disasters.append({
-                "type": "heatwave",
-                "day": i,
-                "severity": "medium" if weather['T2M_MAX'] < 40 else "high",
-                "message": f"🔥 Heatwave warning! Day +{i}: Extreme heat expected ({weather['T2M_MAX']:.1f}°C)"
-            })
-        
-        # Frost detection
-        if weather['T2M_MIN'] < 5:
-            disasters.append({
-                "type": "frost",
-                "day": i,
-                "severity": "medium",
-                "message": f"❄️ Frost warning! Day +{i}: Cold snap coming ({weather['T2M_MIN']:.1f}°C)"
-            })
+    disasters = get_hazard_table().forecast(current_day, FORECAST_HORIZON)
     
     # Random disaster events based on era
     if random.random() < 0.05 and "locust" in ERAS[era]["disasters"]:
@@ -634,7 +602,7 @@ def render_gameplay():
         return
     
     era = ERAS[st.session_state.current_era]
-    weather = nasa_data.iloc[st.session_state.day]
+    weather = get_day_engine().weather(st.session_state.day)
     
     # Predict disasters
     if not st.session_state.upcoming_disasters:
@@ -717,7 +685,7 @@ def render_gameplay():
         w_col1.metric("🌡️ Temp", f"{weather['T2M']:.1f}°C", f"Max: {weather['T2M_MAX']:.1f}°C")
         w_col2.metric("💧 Rain", f"{weather['PRECTOTCORR']:.2f}mm")
         w_col3.metric("💨 Humidity", f"{weather['RH2M']:.1f}%")
-        w_col4.metric("🌱 NDVI", f"{weather['NDVI_raw']:.3f}")
+        w_col4.metric("🌱 NDVI", f"{weather['NDVI_RAW']:.3f}")
         
         # Disaster Map
         st.markdown("### 🗺️ DISASTER MAP")
@@ -782,11 +750,12 @@ def render_gameplay():
         
         if st.button("💡 GET ADVICE", use_container_width=True, disabled=(uses_left <= 0)):
             if uses_left > 0:
-                with st.spinner("🤖 AI analyzing..."):
-                    advice = get_ai_advice(weather, era, st.session_state.upcoming_disasters)
-                    st.info(advice)
-                    st.session_state.ai_uses_today += 1
-                    add_xp(calculate_xp_gain("use_ai"))
+                advice_box = st.empty()
+                advice_box.info("🤖 AI analyzing...")
+                for advice in get_ai_advice(weather, era, st.session_state.upcoming_disasters):
+                    advice_box.info(advice)
+                st.session_state.ai_uses_today += 1
+                add_xp(calculate_xp_gain("use_ai"))
             else:
                 st.warning("No uses left today!")
         
@@ -813,39 +782,45 @@ def render_gameplay():
                 st.success("Bought!")
                 st.rerun()
 
+@st.cache_resource
+def get_advisor():
+    return AdvisorService(model)
+
 def get_ai_advice(weather, era, disasters):
-    """Get AI advice considering disasters"""
+    """Stream AI advice considering disasters, yielding the text so far"""
     if not GEMINI_API_KEY:
-        return "⚠️ Set GEMINI_API_KEY to unlock AI advisor! Visit: https://makersuite.google.com/app/apikey"
+        yield "⚠️ Set GEMINI_API_KEY to unlock AI advisor! Visit: https://makersuite.google.com/app/apikey"
+        return
     
-    try:
-        disaster_text = ""
-        if disasters:
-            disaster_text = f"\\n\\nUPCOMING DISASTERS:\\n" + "\\n".join([f"- {d['message']}" for d in disasters[:3]])
-        
-        prompt = f"""You are a fun, engaging AI farming advisor for Gen Z and older players in {era['years']} Kenya.
+    disaster_text = ""
+    if disasters:
+        disaster_text = f"\\n\\nUPCOMING DISASTERS:\\n" + "\\n".join([f"- {d['message']}" for d in disasters[:3]])
+    
+    prompt = f"""You are a fun, engaging AI farming advisor for Gen Z and older players in {era['years']} Kenya.
 
 Weather (NASA Data):
 - Temp: {weather['T2M']:.1f}°C (Max: {weather['T2M_MAX']:.1f}°C)
 - Rain: {weather['PRECTOTCORR']:.2f}mm
 - Humidity: {weather['RH2M']:.1f}%
-- NDVI: {weather['NDVI_raw']:.4f}
+- NDVI: {weather['NDVI_RAW']:.4f}
 {disaster_text}
 
 Give 2-3 sentences of practical, engaging advice. Use emojis. Be encouraging but realistic. Reference the era's technology level."""
 
-        response = model.generate_content(prompt)
-        return response.text
-    except:
-        return "💭 Yo fam! Check that rainfall - looks kinda sus. Maybe prep for dry times ahead! Stay hydrated 💧"
+    key = advice_key(era['years'], st.session_state.day, 'English', weather,
+                     tuple(d['message'] for d in disasters[:3]))
+    job = get_advisor().ask(key, prompt)
+    yield from job.stream()
+    if job.error is not None or not job.text:
+        yield "💭 Yo fam! Check that rainfall - looks kinda sus. Maybe prep for dry times ahead! Stay hydrated 💧"
 
 def advance_day(nasa_data, era):
     """Advance day with disaster checks"""
-    st.session_state.day += 1
     st.session_state.ai_uses_today = 0
+    era_complete = get_day_engine().advance(st.session_state, st.session_state.current_era)
     
     # Check if era complete
-    if st.session_state.day >= st.session_state.era_end_day:
+    if era_complete:
         st.session_state.era_progress[st.session_state.current_era]['completed'] = True
         st.session_state.last_achievement = f"🎉 {era['name']} COMPLETED! You're a legend!"
         
@@ -860,11 +835,6 @@ def advance_day(nasa_data, era):
         st.session_state.current_screen = 'era_selection'
         return
     
-    # Weather effects
-    weather = nasa_data.iloc[st.session_state.day]
-    rain_water = int(weather['PRECTOTCORR'] * 5)
-    st.session_state.water = min(100, st.session_state.water + rain_water)
-    
     # Check for disasters
     active_disasters = [d for d in st.session_state.upcoming_disasters if d['day'] == 1]
     
@@ -0,0 +1,51 @@
+"""Daily update cost for list-of-dict plots vs FarmArrays, from 4 to 100k plots.
+
+Run from the repo root: python bench_farm_arrays.py
+"""
+import random
+import sys
+import time
+
+import farm_rules
+from farm_arrays import FarmArrays
+from farm_engine import DayEngine
+
+DAYS = 30
+
+
+def make_plots(n, seed=0):
+    rng = random.Random(seed)
+    crops = list(farm_rules.CROP_TYPES)
+    return [
+        {"crop": rng.choice(crops + [None]), "planted_day": rng.randrange(10), "health": 100, "watered": rng.random() < 0.3}
+        for _ in range(n)
+    ]
+
+
+def run(engine, plots):
+    state = farm_rules.new_state()
+    farm_rules.enter_era(state, "1980s")
+    state['farm_plots'] = plots
+    start = time.perf_counter()
+    for _ in range(DAYS):
+        engine.advance(state, "1980s")
+        if isinstance(plots, FarmArrays):
+            plots.harvest_values().sum()
+        else:
+            sum(farm_rules.harvest_value(plot) for plot in plots if plot['crop'])
+    return (time.perf_counter() - start) / DAYS
+
+
+def main():
+    engine = DayEngine()
+    print(f"{'plots':>8} {'dicts ms/day':>13} {'arrays ms/day':>14} {'dict MB':>8} {'array KB':>9}")
+    for n in (4, 100, 1_000, 10_000, 100_000):
+        plots = make_plots(n)
+        farm = FarmArrays.from_plots(plots)
+        dict_bytes = sum(sys.getsizeof(plot) for plot in plots) + sys.getsizeof(plots)
+        print(f"{n:>8} {run(engine, plots) * 1e3:>13.3f} {run(engine, farm) * 1e3:>14.3f} "
+              f"{dict_bytes / 1e6:>8.2f} {farm.nbytes / 1e3:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
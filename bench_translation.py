@@ -0,0 +1,43 @@
+"""First-render and warm translation cost for one screen, using StubModel with simulated latency.
+
+Run from the repo root: python bench_translation.py
+"""
+import tempfile
+import time
+from pathlib import Path
+
+from translation import StubModel, Translator
+
+SCREEN = [f"UI string number {i} 🌾" for i in range(40)]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main(latency=0.05):
+    with tempfile.TemporaryDirectory() as tmp:
+        store = Path(tmp) / "translations.db"
+
+        per_string = Translator(StubModel(latency), store_path=None)
+        serial = timed(lambda: [per_string.translate(text, "Kiswahili") for text in SCREEN])
+
+        model = StubModel(latency)
+        batched = Translator(model, store_path=store)
+        batch = timed(lambda: batched.prefetch(SCREEN, "Kiswahili"))
+        warm = timed(lambda: [batched.lookup(text, "Kiswahili") for text in SCREEN])
+
+        restarted = Translator(StubModel(latency), store_path=store)
+        from_disk = timed(lambda: restarted.prefetch(SCREEN, "Kiswahili"))
+
+    print(f"{len(SCREEN)} strings, {latency * 1e3:.0f} ms per model call")
+    print(f"per-string calls (old)    {serial * 1e3:9.1f} ms")
+    print(f"one batched prefetch      {batch * 1e3:9.1f} ms ({model.calls} call)")
+    print(f"warm LRU lookups          {warm * 1e3:9.3f} ms")
+    print(f"after restart (disk)      {from_disk * 1e3:9.3f} ms ({restarted.model.calls} calls)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Historical events indexed by (era, day) for O(1) daily dispatch and range lookups.
+
+Each event gets a stable 'id' ("<era>:<day>:<name>"). Callers track triggered
+events as a set of ids, which stays cheap however many events an era holds.
+"""
+from bisect import bisect_left, bisect_right
+
+
+def event_id(era, event):
+    return f"{era}:{event['day']}:{event['name']}"
+
+
+class EventScheduler:
+    def __init__(self, events_by_era):
+        self.by_day = {}
+        self.days = {}
+        for era, events in events_by_era.items():
+            for event in events:
+                event.setdefault('id', event_id(era, event))
+                self.by_day.setdefault((era, event['day']), []).append(event)
+            self.days[era] = sorted({event['day'] for event in events})
+
+    def on_day(self, era, day):
+        """Events scheduled for exactly this era day"""
+        return self.by_day.get((era, day), [])
+
+    def between(self, era, first_day, last_day):
+        """Events scheduled from first_day through last_day, in day order"""
+        days = self.days.get(era, [])
+        lo, hi = bisect_left(days, first_day), bisect_right(days, last_day)
+        return [event for day in days[lo:hi] for event in self.by_day[(era, day)]]
+
+    def upcoming(self, era, day, n_days):
+        """Events in the next n_days after day"""
+        return self.between(era, day + 1, day + n_days)
+
+    def fire(self, era, first_day, last_day, triggered):
+        """Untriggered events from first_day through last_day; marks them triggered.
+
+        Pass a range longer than one day to fast-forward without skipping events.
+        """
+        due = [event for event in self.between(era, first_day, last_day) if event['id'] not in triggered]
+        triggered.update(event['id'] for event in due)
+        return due
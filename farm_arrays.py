@@ -0,0 +1,114 @@
+"""Structure-of-arrays farm for hundreds or thousands of plots.
+
+Each plot is one slot in parallel arrays: crop id (int8, -1 for empty),
+planted day (int16), health (uint8) and a packed watered bitset. The daily
+decay, growth and harvest valuation run as vectorized NumPy ops over every
+plot at once. from_plots()/to_plots() convert to and from the list-of-dicts
+format in saves, so existing saves keep loading.
+
+Health is clamped to 0..100 to fit uint8. The dict model lets neglected plots
+go negative, and therefore lose money at harvest.
+"""
+import numpy as np
+
+from farm_rules import CROP_TYPES, WATER_HEALTH_GAIN
+
+CROP_IDS = list(CROP_TYPES)
+EMPTY = -1
+CROP_DAYS = np.array([CROP_TYPES[crop]['days'] for crop in CROP_IDS], dtype=np.int16)
+CROP_VALUES = np.array([CROP_TYPES[crop]['value'] for crop in CROP_IDS], dtype=np.int32)
+
+
+class FarmArrays:
+    def __init__(self, n_plots):
+        self.crop = np.full(n_plots, EMPTY, dtype=np.int8)
+        self.planted_day = np.zeros(n_plots, dtype=np.int16)
+        self.health = np.full(n_plots, 100, dtype=np.uint8)
+        self.watered = np.zeros((n_plots + 7) // 8, dtype=np.uint8)
+
+    def __len__(self):
+        return len(self.crop)
+
+    @property
+    def nbytes(self):
+        return self.crop.nbytes + self.planted_day.nbytes + self.health.nbytes + self.watered.nbytes
+
+    def watered_mask(self):
+        return np.unpackbits(self.watered, count=len(self), bitorder='little').astype(bool)
+
+    def set_watered(self, mask):
+        self.watered = np.packbits(mask, bitorder='little')
+
+    def planted(self):
+        return self.crop != EMPTY
+
+    def growth(self, day):
+        """Percent grown per plot, capped at 100; 0 for empty plots"""
+        planted = self.planted()
+        days = CROP_DAYS[np.where(planted, self.crop, 0)]
+        pct = np.minimum(100.0, (day - self.planted_day.astype(np.int32)) / days * 100)
+        return np.where(planted, pct, 0.0)
+
+    def ready(self, day):
+        return self.planted() & (self.growth(day) >= 100)
+
+    def plant(self, idx, crop, day):
+        """Plant crop in the empty plots among idx; returns how many were planted"""
+        idx = np.asarray(idx)
+        idx = idx[self.crop[idx] == EMPTY]
+        self.crop[idx] = CROP_IDS.index(crop)
+        self.planted_day[idx] = day
+        return len(idx)
+
+    def water(self, idx):
+        """Give the planted plots among idx a health boost, like the Water button"""
+        idx = np.asarray(idx)
+        idx = idx[self.crop[idx] != EMPTY]
+        self.health[idx] = np.minimum(100, self.health[idx].astype(np.int16) + WATER_HEALTH_GAIN)
+        return len(idx)
+
+    def harvest_values(self):
+        """What each plot would sell for now (0 for empty plots)"""
+        planted = self.planted()
+        # Same float expression as int(value * (health / 100)) in farm_rules.harvest_value
+        values = (CROP_VALUES[np.where(planted, self.crop, 0)] * (self.health / 100)).astype(np.int32)
+        return np.where(planted, values, 0)
+
+    def harvest(self, day):
+        """Harvest every ready plot; returns (plots harvested, money earned)"""
+        ready = self.ready(day)
+        earned = int(self.harvest_values()[ready].sum())
+        self.crop[ready] = EMPTY
+        return int(ready.sum()), earned
+
+    def decay(self, days, loss):
+        """Health lost over days without water; a watered plot skips one day, then flags reset"""
+        dry_days = days - self.watered_mask().astype(np.int16)
+        lost = np.where(self.planted(), loss * dry_days, 0)
+        self.health = np.clip(self.health.astype(np.int32) - lost, 0, 100).astype(np.uint8)
+        self.watered[:] = 0
+
+    @classmethod
+    def from_plots(cls, plots):
+        """Build from the save format: a list of {crop, planted_day, health, watered} dicts"""
+        farm = cls(len(plots))
+        for i, plot in enumerate(plots):
+            if plot.get('crop'):
+                farm.crop[i] = CROP_IDS.index(plot['crop'])
+            farm.planted_day[i] = plot.get('planted_day', 0)
+            farm.health[i] = min(100, max(0, plot.get('health', 100)))
+        farm.set_watered(np.array([bool(plot.get('watered')) for plot in plots], dtype=bool))
+        return farm
+
+    def to_plots(self):
+        """The save format, ready for json.dumps"""
+        watered = self.watered_mask()
+        return [
+            {
+                "crop": CROP_IDS[crop] if crop != EMPTY else None,
+                "planted_day": int(day),
+                "health": int(health),
+                "watered": bool(w),
+            }
+            for crop, day, health, w in zip(self.crop.tolist(), self.planted_day.tolist(), self.health.tolist(), watered)
+        ]
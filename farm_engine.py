@@ -0,0 +1,85 @@
+"""Day-advance rules for the farm, driven by per-era NumPy arrays.
+
+The arrays are built once per era, so a "Next Day" click reads plain indexed
+values instead of building a pandas Series with nasa_data.iloc. Advancing
+several days at once sums the precomputed arrays, so it costs the same as
+advancing one day.
+"""
+import numpy as np
+
+from Backend.climate_data import get_climate_data
+
+
+class EraWeather:
+    """Per-day arrays for one era, covering dataset days first..last"""
+
+    def __init__(self, climate, era, rain_factor):
+        self.first, self.last = climate.era_bounds(era)
+        stop = self.last + 1
+        columns = climate.float64_arrays()
+
+        # int(rain * factor) in the old handler truncates; rain is never negative so floor matches it
+        self.rain_water = np.floor(columns['PRECTOTCORR'][self.first:stop] * rain_factor).astype(np.int64)
+        self.rain_water_cumsum = np.concatenate(([0], np.cumsum(self.rain_water)))
+
+    def rain_total(self, after_day, through_day):
+        """Water gained from rain on days after_day+1 .. through_day"""
+        lo = max(after_day + 1, self.first) - self.first
+        hi = min(through_day, self.last) - self.first + 1
+        if hi <= lo:
+            return 0
+        return int(self.rain_water_cumsum[hi] - self.rain_water_cumsum[lo])
+
+
+class DayEngine:
+    """Advances game state using precomputed weather arrays instead of per-row lookups"""
+
+    def __init__(self, climate=None, rain_factor=3, water_cap=100, dry_health_loss=5):
+        self.climate = climate or get_climate_data()
+        self.rain_factor = rain_factor
+        self.water_cap = water_cap
+        self.dry_health_loss = dry_health_loss
+        self._columns = self.climate.float64_arrays()
+        self._eras = {}
+
+    def era(self, era):
+        if era not in self._eras:
+            self._eras[era] = EraWeather(self.climate, era, self.rain_factor)
+        return self._eras[era]
+
+    def weather(self, day):
+        """One day's readings as a dict, e.g. weather['T2M']"""
+        return {col: float(values[day]) for col, values in self._columns.items()}
+
+    def advance(self, state, era, n=1):
+        """Move state forward up to n days in one step; returns True if the era's end was reached.
+
+        state is st.session_state or any mapping with day, era_end_day and water,
+        plus optional era_day and farm_plots (a list of plot dicts or a FarmArrays).
+        """
+        day = state['day']
+        end_day = state['era_end_day']
+        steps = min(n, max(end_day - day, 1))
+        new_day = day + steps
+        complete = new_day >= end_day
+
+        # Reaching the last day ends the era before that day's weather and crop updates run
+        applied = steps - 1 if complete else steps
+        if applied > 0:
+            rain = self.era(era).rain_total(day, day + applied)
+            state['water'] = min(self.water_cap, state['water'] + rain)
+
+            plots = state.get('farm_plots', [])
+            if hasattr(plots, 'decay'):
+                # farm_arrays.FarmArrays: one vectorized update for every plot
+                plots.decay(applied, self.dry_health_loss)
+            else:
+                for plot in plots:
+                    if plot['crop']:
+                        plot['health'] -= self.dry_health_loss * (applied - (1 if plot['watered'] else 0))
+                    plot['watered'] = False
+
+        state['day'] = new_day
+        if 'era_day' in state:
+            state['era_day'] += steps
+        return complete
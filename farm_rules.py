@@ -0,0 +1,144 @@
+"""Farm rules as plain functions over a state mapping.
+
+The state uses the keys app.py keeps in st.session_state (money, seeds, water,
+xp, day, era_day, era_end_day, farm_plots, era_progress, current_era). The UI
+passes st.session_state and the batch simulator (simulate.py) passes a plain
+dict. Actions return False when they aren't allowed; the buttons treat that
+as a silent no-op.
+"""
+from Backend.climate_data import ERA_DAY_RANGES
+
+CROP_TYPES = {
+    "maize": {"name": "Maize", "emoji": "🌽", "days": 15, "value": 50},
+    "beans": {"name": "Beans", "emoji": "🫘", "days": 12, "value": 40},
+    "coffee": {"name": "Coffee", "emoji": "☕", "days": 30, "value": 150},
+    "sukuma": {"name": "Sukuma Wiki", "emoji": "🥬", "days": 8, "value": 30},
+    "tomatoes": {"name": "Tomatoes", "emoji": "🍅", "days": 18, "value": 60},
+}
+
+ERA_ORDER = list(ERA_DAY_RANGES)
+N_PLOTS = 4
+WATER_COST = 5
+WATER_HEALTH_GAIN = 10
+HARVEST_XP = 25
+SEED_PACK = 5
+WATER_PACK = 20
+WATER_PACK_PRICE = 50
+
+
+def new_plot():
+    return {"crop": None, "planted_day": 0, "health": 100, "watered": False}
+
+
+def new_state(money=1000, seeds=50, water=100, n_plots=N_PLOTS):
+    """Fresh game state with the first era unlocked and no era entered yet"""
+    return {
+        "money": money,
+        "seeds": seeds,
+        "water": water,
+        "xp": 0,
+        "farm_plots": [new_plot() for _ in range(n_plots)],
+        "current_era": None,
+        "day": 0,
+        "era_day": 0,
+        "era_progress": {
+            era: {"unlocked": i == 0, "events_completed": 0, "completed": False}
+            for i, era in enumerate(ERA_ORDER)
+        },
+    }
+
+
+def enter_era(state, era):
+    """Start era at the first day of its data range"""
+    start_day, end_day = ERA_DAY_RANGES[era]
+    state['current_era'] = era
+    state['day'] = start_day
+    state['era_start_day'] = start_day
+    state['era_end_day'] = end_day
+    state['era_day'] = 0
+
+
+def growth(state, plot):
+    """Percent grown, capped at 100"""
+    crop = CROP_TYPES[plot['crop']]
+    return min(100, ((state['day'] - plot['planted_day']) / crop['days']) * 100)
+
+
+def is_ready(state, plot):
+    return plot['crop'] is not None and growth(state, plot) >= 100
+
+
+def plant(state, i, crop):
+    plot = state['farm_plots'][i]
+    if plot['crop'] or state['seeds'] < 1:
+        return False
+    state['seeds'] -= 1
+    plot['crop'] = crop
+    plot['planted_day'] = state['day']
+    return True
+
+
+def water_plot(state, i):
+    plot = state['farm_plots'][i]
+    if not plot['crop'] or state['water'] < WATER_COST:
+        return False
+    state['water'] -= WATER_COST
+    plot['health'] = min(100, plot['health'] + WATER_HEALTH_GAIN)
+    return True
+
+
+def harvest_value(plot):
+    return int(CROP_TYPES[plot['crop']]['value'] * (plot['health'] / 100))
+
+
+def harvest(state, i):
+    """Sell a grown crop; returns the money earned, or False if it isn't ready"""
+    plot = state['farm_plots'][i]
+    if not is_ready(state, plot):
+        return False
+    value = harvest_value(plot)
+    state['money'] += value
+    state['xp'] += HARVEST_XP
+    plot['crop'] = None
+    return value
+
+
+def seed_price(crop):
+    return CROP_TYPES[crop]['value'] // 3
+
+
+def buy_seeds(state, crop):
+    price = seed_price(crop)
+    if state['money'] < price:
+        return False
+    state['money'] -= price
+    state['seeds'] += SEED_PACK
+    return True
+
+
+def buy_water(state):
+    if state['money'] < WATER_PACK_PRICE:
+        return False
+    state['money'] -= WATER_PACK_PRICE
+    state['water'] += WATER_PACK
+    return True
+
+
+def complete_era(state):
+    """Mark the current era completed and unlock the next; returns the next era or None"""
+    era = state['current_era']
+    state['era_progress'][era]['completed'] = True
+    idx = ERA_ORDER.index(era)
+    if idx < len(ERA_ORDER) - 1:
+        next_era = ERA_ORDER[idx + 1]
+        state['era_progress'][next_era]['unlocked'] = True
+        return next_era
+    return None
+
+
+def next_day(state, engine, n=1):
+    """Rain to water, health decay and day count via engine; returns True when the era finished"""
+    complete = engine.advance(state, state['current_era'], n)
+    if complete:
+        complete_era(state)
+    return complete
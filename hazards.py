@@ -0,0 +1,131 @@
+"""Weather hazard tables computed once over the whole NASA dataset.
+
+Every hazard is a boolean mask over all days. Windowed hazards such as dry
+spells come from a cumulative sum, not a per-day loop. The hits are stored
+sorted by day with per-day offsets, so a forecast is one slice of the table.
+"""
+import copy
+
+import numpy as np
+
+from Backend.climate_data import get_climate_data
+
+FORECAST_HORIZON = 7
+
+# Thresholds per hazard; set dry_spell "days" to a number to turn it on
+HAZARD_THRESHOLDS = {
+    "drought": {"max_rain": 0.5, "max_soil_wetness": 0.3, "high_below_wetness": 0.2},
+    "flood": {"min_rain": 20},
+    "heatwave": {"min_t_max": 35, "high_from_t_max": 40},
+    "frost": {"max_t_min": 5},
+    "dry_spell": {"days": None, "max_rain": 1.0},
+}
+
+MESSAGES = {
+    "drought": "🏜️ Drought warning! Day +{i}: Very low rainfall expected ({value:.2f}mm)",
+    "flood": "🌊 Flood alert! Day +{i}: Heavy rainfall incoming ({value:.1f}mm)",
+    "heatwave": "🔥 Heatwave warning! Day +{i}: Extreme heat expected ({value:.1f}°C)",
+    "frost": "❄️ Frost warning! Day +{i}: Cold snap coming ({value:.1f}°C)",
+    "dry_spell": "🌵 Dry spell! Day +{i}: {value:.0f} days in a row without real rain",
+}
+
+SEVERITIES = ["low", "medium", "high", "critical"]
+
+
+def window_all(mask, days):
+    """True where the `days` days ending here are all True (cumulative-sum sliding window)"""
+    counts = np.concatenate(([0], np.cumsum(mask, dtype=np.int64)))
+    result = np.zeros(len(mask), dtype=bool)
+    if days <= len(mask):
+        result[days - 1:] = (counts[days:] - counts[:-days]) == days
+    return result
+
+
+def merge_thresholds(overrides):
+    thresholds = copy.deepcopy(HAZARD_THRESHOLDS)
+    for hazard, values in (overrides or {}).items():
+        thresholds[hazard].update(values)
+    return thresholds
+
+
+class HazardTable:
+    """Precomputed hazard hits for every day, sliced per forecast"""
+
+    def __init__(self, climate=None, thresholds=None, horizon=FORECAST_HORIZON):
+        self.climate = climate or get_climate_data()
+        self.thresholds = merge_thresholds(thresholds)
+        self.horizon = horizon
+        self.n_days = self.climate.n_days
+
+        cols = self.climate.float64_arrays()
+        rain, wetness = cols['PRECTOTCORR'], cols['GWETPROF']
+        t_max, t_min = cols['T2M_MAX'], cols['T2M_MIN']
+        medium, high = SEVERITIES.index("medium"), SEVERITIES.index("high")
+
+        # hazard -> (mask, severity index per day, value shown in the message)
+        th = self.thresholds
+        self.hazards = {
+            "drought": (
+                (rain < th["drought"]["max_rain"]) & (wetness < th["drought"]["max_soil_wetness"]),
+                np.where(wetness < th["drought"]["high_below_wetness"], high, medium),
+                rain,
+            ),
+            "flood": (rain > th["flood"]["min_rain"], np.full(self.n_days, high), rain),
+            "heatwave": (
+                t_max > th["heatwave"]["min_t_max"],
+                np.where(t_max < th["heatwave"]["high_from_t_max"], medium, high),
+                t_max,
+            ),
+            "frost": (t_min < th["frost"]["max_t_min"], np.full(self.n_days, medium), t_min),
+        }
+        spell_days = th["dry_spell"]["days"]
+        if spell_days:
+            self.hazards["dry_spell"] = (
+                window_all(rain < th["dry_spell"]["max_rain"], spell_days),
+                np.full(self.n_days, medium),
+                np.full(self.n_days, float(spell_days)),
+            )
+        self._build_table()
+
+    def _build_table(self):
+        names = list(self.hazards)
+        days, kinds = [], []
+        for k, name in enumerate(names):
+            hit_days = np.flatnonzero(self.hazards[name][0])
+            days.append(hit_days)
+            kinds.append(np.full(len(hit_days), k))
+        days = np.concatenate(days)
+        kinds = np.concatenate(kinds)
+
+        # Sort by day, then by hazard order, matching the old loop's output order
+        order = np.lexsort((kinds, days))
+        self.event_days = days[order]
+        self.event_kinds = kinds[order]
+        severities = np.stack([self.hazards[name][1] for name in names])
+        values = np.stack([self.hazards[name][2] for name in names])
+        self.event_severity = severities[self.event_kinds, self.event_days].astype(np.int8)
+        self.event_values = values[self.event_kinds, self.event_days]
+        self.names = names
+        # offsets[d] is the first table row on or after day d
+        self.offsets = np.searchsorted(self.event_days, np.arange(self.n_days + 1))
+
+    def mask(self, hazard):
+        return self.hazards[hazard][0]
+
+    def forecast(self, current_day, horizon=None):
+        """Warnings for days current_day+1 .. current_day+horizon, nearest first"""
+        horizon = self.horizon if horizon is None else horizon
+        lo = self.offsets[min(current_day + 1, self.n_days)]
+        hi = self.offsets[min(current_day + horizon + 1, self.n_days)]
+
+        warnings = []
+        for row in range(lo, hi):
+            name = self.names[self.event_kinds[row]]
+            i = int(self.event_days[row]) - current_day
+            warnings.append({
+                "type": name,
+                "day": i,
+                "severity": SEVERITIES[self.event_severity[row]],
+                "message": MESSAGES[name].format(i=i, value=self.event_values[row]),
+            })
+        return warnings
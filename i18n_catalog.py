@@ -0,0 +1,134 @@
+"""Offline translation catalog for the static UI strings in app.py.
+
+Build step (run after changing UI text):
+
+    python i18n_catalog.py --lang Kiswahili          # fills gaps with Gemini (GEMINI_API_KEY)
+    python i18n_catalog.py --lang Kiswahili --stub --out /tmp/locales   # offline StubModel, never into locales/
+
+The build collects every t("literal") in app.py, plus the translatable fields
+of ERAS, HISTORICAL_EVENTS and CROP_TYPES (the latter lives in farm_rules.py). It merges them into the editable
+locales/<lang>.json and asks the model only for entries that are still empty.
+The result is compiled to locales/catalog.pickle. At runtime the compiled
+catalog is loaded once and answers lookups before any cache or model, so stub
+placeholders must never be written there; --stub builds need their own --out.
+"""
+import argparse
+import ast
+import json
+import os
+import pickle
+from pathlib import Path
+from types import MappingProxyType
+
+ROOT = Path(__file__).parent
+SOURCES = (ROOT / "app.py", ROOT / "farm_rules.py")
+LOCALES_DIR = ROOT / "locales"
+CATALOG_PATH = LOCALES_DIR / "catalog.pickle"
+
+# Top-level dicts in SOURCES and the keys inside them that go through t()
+TRANSLATABLE_FIELDS = {
+    "ERAS": ("name", "description", "challenges"),
+    "HISTORICAL_EVENTS": ("name", "description", "challenge"),
+    "CROP_TYPES": ("name",),
+}
+
+
+def _string_values(node):
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return [node.value]
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return [s for elt in node.elts for s in _string_values(elt)]
+    return []
+
+
+def _dict_fields(node, keys):
+    """String values stored under any of keys, anywhere inside a literal dict/list"""
+    found = []
+    for child in ast.walk(node):
+        if isinstance(child, ast.Dict):
+            for key, value in zip(child.keys, child.values):
+                if isinstance(key, ast.Constant) and key.value in keys:
+                    found.extend(_string_values(value))
+    return found
+
+
+def extract_strings(source_paths=SOURCES):
+    """Every static string the UI passes to t(), in first-seen order"""
+    strings = []
+    for source_path in source_paths:
+        strings.extend(_extract_file(source_path))
+    return list(dict.fromkeys(strings))
+
+
+def _extract_file(source_path):
+    tree = ast.parse(Path(source_path).read_text(encoding="utf-8"))
+    strings = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "t":
+            if node.args and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str):
+                strings.append(node.args[0].value)
+        elif isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            keys = TRANSLATABLE_FIELDS.get(node.targets[0].id)
+            if keys:
+                strings.extend(_dict_fields(node.value, keys))
+    return strings
+
+
+def build_catalog(langs, translator=None, source_paths=SOURCES, locales_dir=LOCALES_DIR):
+    """Refresh <locales_dir>/<lang>.json for each language and compile <locales_dir>/catalog.pickle"""
+    strings = extract_strings(source_paths)
+    locales_dir = Path(locales_dir)
+    locales_dir.mkdir(parents=True, exist_ok=True)
+    catalog = {}
+    for lang in langs:
+        source = locales_dir / f"{lang}.json"
+        entries = json.loads(source.read_text(encoding="utf-8")) if source.exists() else {}
+        entries = {text: entries.get(text, "") for text in strings}
+
+        missing = [text for text, translated in entries.items() if not translated]
+        if missing and translator is not None:
+            translator.prefetch(missing, lang)
+            for text in missing:
+                entries[text] = translator.lookup(text, lang) or ""
+
+        source.write_text(json.dumps(entries, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        catalog[lang] = {text: translated for text, translated in entries.items() if translated}
+
+    with open(locales_dir / CATALOG_PATH.name, "wb") as f:
+        pickle.dump(catalog, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return catalog
+
+
+def load_catalog(path=CATALOG_PATH):
+    """{lang: read-only {text: translation}}, or {} if the catalog hasn't been built"""
+    try:
+        with open(path, "rb") as f:
+            catalog = pickle.load(f)
+    except FileNotFoundError:
+        return {}
+    return {lang: MappingProxyType(entries) for lang, entries in catalog.items()}
+
+
+if __name__ == "__main__":
+    from translation import StubModel, Translator
+
+    parser = argparse.ArgumentParser(description="Extract and compile the static UI translation catalog")
+    parser.add_argument("--lang", action="append", default=[], help="target language (repeatable)")
+    parser.add_argument("--stub", action="store_true", help="fill gaps with the offline StubModel (requires --out)")
+    parser.add_argument("--out", type=Path, default=LOCALES_DIR, help=f"output directory (default: {LOCALES_DIR})")
+    args = parser.parse_args()
+    if args.stub and args.out.resolve() == LOCALES_DIR.resolve():
+        parser.error("--stub placeholders would be served as real translations; pass --out to write them elsewhere")
+
+    model = None
+    if args.stub:
+        model = StubModel()
+    elif os.getenv("GEMINI_API_KEY"):
+        import google.generativeai as genai
+        genai.configure(api_key=os.environ["GEMINI_API_KEY"])
+        model = genai.GenerativeModel('gemini-pro')
+
+    translator = Translator(model, store_path=None) if model else None
+    result = build_catalog(args.lang or ["Kiswahili"], translator, locales_dir=args.out)
+    for lang, entries in result.items():
+        print(f"{lang}: {len(entries)}/{len(extract_strings())} strings translated -> {args.out / CATALOG_PATH.name}")
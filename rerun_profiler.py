@@ -0,0 +1,74 @@
+"""Counts Streamlit script and fragment executions and their wall time.
+
+Set PROFILE_RERUNS=1 and every profiled unit run is appended to
+.cache/reruns.csv as (mode, unit, ms). Click through the same actions once
+normally and once with FULL_RERUNS=1, then compare:
+
+    python rerun_profiler.py
+"""
+import csv
+import functools
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+PROFILE_PATH = Path(__file__).with_name(".cache") / "reruns.csv"
+
+
+class RerunProfiler:
+    def __init__(self, path=PROFILE_PATH, mode="fragments"):
+        self.path = Path(path)
+        self.mode = mode
+        self.stats = defaultdict(lambda: [0, 0.0])
+        self.lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def record(self, unit, seconds):
+        with self.lock:
+            entry = self.stats[(self.mode, unit)]
+            entry[0] += 1
+            entry[1] += seconds
+            with open(self.path, "a", newline="") as f:
+                csv.writer(f).writerow([self.mode, unit, f"{seconds * 1e3:.3f}"])
+
+    def summary(self):
+        """[(mode, unit, runs, mean ms)] for this process"""
+        with self.lock:
+            return [(mode, unit, n, total * 1e3 / n) for (mode, unit), (n, total) in sorted(self.stats.items())]
+
+
+PROFILER = RerunProfiler() if os.getenv("PROFILE_RERUNS") else None
+
+
+def profiled(unit):
+    """Record each call of the decorated function as one run of unit (no-op unless profiling)"""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if PROFILER is None:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                # st.rerun() raises out of the unit, so time it either way
+                PROFILER.record(unit, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+def summarize(path=PROFILE_PATH):
+    totals = defaultdict(list)
+    with open(path, newline="") as f:
+        for mode, unit, ms in csv.reader(f):
+            totals[(mode, unit)].append(float(ms))
+    print(f"{'mode':<10} {'unit':<8} {'runs':>6} {'mean ms':>9} {'total ms':>10}")
+    for (mode, unit), times in sorted(totals.items()):
+        print(f"{mode:<10} {unit:<8} {len(times):>6} {sum(times) / len(times):>9.2f} {sum(times):>10.1f}")
+
+
+if __name__ == "__main__":
+    summarize(sys.argv[1] if len(sys.argv) > 1 else PROFILE_PATH)
@@ -0,0 +1,459 @@
+"""Player saves behind a pluggable backend, written by a coalescing background writer.
+
+JournalSaveBackend keeps one snapshot file per player plus a journal of the
+fields that changed; every `compact_every` entries the journal is folded back
+into a snapshot written to a temp file and renamed into place.
+SqliteSaveBackend stores players, era progress and farm plots as indexed rows
+in one WAL-mode database, for classroom sessions with hundreds of players.
+SaveWriter coalesces rapid saves and hands them to the backend in batches
+from a background thread after a short, bounded delay.
+"""
+import argparse
+import atexit
+import copy
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Bookkeeping key stored in snapshots so stale journal entries are never replayed
+SEQ_KEY = "_journal_seq"
+ENCODINGS = ("json", "msgpack")
+
+
+def safe_player_name(player_name):
+    return "".join(c for c in player_name if c.isalnum()).lower()
+
+
+def encode(obj, encoding):
+    if encoding == "msgpack":
+        return msgpack.packb(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def decode(data, encoding):
+    if encoding == "msgpack":
+        return msgpack.unpackb(data)
+    return json.loads(data)
+
+
+class JournaledSave:
+    """One player's save file and its append-only journal"""
+
+    def __init__(self, saves_dir, player_name, encoding="json", compact_every=50):
+        if encoding not in ENCODINGS:
+            raise ValueError(f"Unknown save encoding '{encoding}'")
+        if encoding == "msgpack" and msgpack is None:
+            raise RuntimeError("msgpack is not installed; use encoding='json'")
+        self.encoding = encoding
+        self.compact_every = compact_every
+        stem = f"{safe_player_name(player_name)}_save"
+        ext = "json" if encoding == "json" else "msgpack"
+        self.snapshot_path = Path(saves_dir) / f"{stem}.{ext}"
+        self.journal_path = Path(saves_dir) / f"{stem}.{ext}.journal"
+        self.state = None
+        self.seq = 0
+        self.journal_entries = 0
+
+    def load(self):
+        """Snapshot with the journal replayed on top, or None if there is no save"""
+        state, seq = {}, 0
+        if self.snapshot_path.exists():
+            state = decode(self.snapshot_path.read_bytes(), self.encoding)
+            seq = state.pop(SEQ_KEY, 0)
+
+        entries = 0
+        for entry_seq, delta in self._read_journal():
+            if entry_seq > seq:
+                state.update(delta)
+                seq = entry_seq
+            entries += 1
+
+        self.state, self.seq, self.journal_entries = state, seq, entries
+        return state or None
+
+    def _read_journal(self):
+        """Complete journal entries; a torn or invalid tail is cut off so later appends start clean"""
+        if not self.journal_path.exists():
+            return []
+        data = self.journal_path.read_bytes()
+        entries, good_end = [], 0
+        if self.encoding == "msgpack":
+            unpacker = msgpack.Unpacker(raw=False)
+            unpacker.feed(data)
+            try:
+                for entry in unpacker:
+                    if not isinstance(entry, list) or len(entry) != 2:
+                        break
+                    entries.append((entry[0], entry[1]))
+                    good_end = unpacker.tell()
+            except ValueError:
+                pass
+        else:
+            for line in data.splitlines(keepends=True):
+                # A line without its newline was cut short mid-append, even if it happens to parse
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                entries.append((entry[0], entry[1]))
+                good_end += len(line)
+
+        if good_end < len(data):
+            # Appending after the partial bytes would glue the next entry onto them
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(good_end)
+        return entries
+
+    def save(self, data):
+        """Persist data, writing only changed fields; returns bytes written"""
+        if self.state is None:
+            self.load()
+
+        delta = {key: value for key, value in data.items() if self.state.get(key) != value or key not in self.state}
+        if not delta:
+            return 0
+
+        self.seq += 1
+        self.state.update(copy.deepcopy(delta))
+        try:
+            if not self.snapshot_path.exists() or self.journal_entries >= self.compact_every:
+                return self._write_snapshot()
+            return self._append(delta)
+        except BaseException:
+            # The delta never reached disk; diff the next save against what did
+            self.state = None
+            raise
+
+    def _append(self, delta):
+        payload = encode([self.seq, delta], self.encoding)
+        if self.encoding == "json":
+            payload += b"\n"
+        with open(self.journal_path, "ab") as f:
+            f.write(payload)
+        self.journal_entries += 1
+        return len(payload)
+
+    def _write_snapshot(self):
+        payload = encode({**self.state, SEQ_KEY: self.seq}, self.encoding)
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.snapshot_path.parent, prefix=self.snapshot_path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        # Entries left behind by a crash here have seq <= the snapshot's and are skipped on load
+        self.journal_path.unlink(missing_ok=True)
+        self.journal_entries = 0
+        return len(payload)
+
+
+class JournalSaveBackend:
+    """One snapshot + journal pair per player in saves_dir"""
+
+    def __init__(self, saves_dir, encoding="json", compact_every=50):
+        self.saves_dir = Path(saves_dir)
+        self.encoding = encoding
+        self.compact_every = compact_every
+        self.files = {}
+
+    def _file(self, player_name):
+        key = safe_player_name(player_name)
+        if key not in self.files:
+            self.files[key] = JournaledSave(self.saves_dir, player_name, self.encoding, self.compact_every)
+        return self.files[key]
+
+    def save_many(self, batch):
+        for player_name, data in batch.items():
+            self._file(player_name).save(data)
+
+    def load(self, player_name):
+        return self._file(player_name).load()
+
+    def list_players(self, limit=100, offset=0):
+        ext = "json" if self.encoding == "json" else "msgpack"
+        names = sorted(p.name[:-len(f"_save.{ext}")] for p in self.saves_dir.glob(f"*_save.{ext}"))
+        return names[offset:offset + limit]
+
+    def close(self):
+        pass
+
+
+PLAYER_COLUMNS = (
+    "player_name", "avatar", "dark_mode", "last_save", "level", "xp", "energy",
+    "money", "seeds", "water", "fertilizer", "current_era", "day",
+    "active_events", "completed_challenges",
+)
+JSON_COLUMNS = {"avatar", "active_events", "completed_challenges"}
+TABLE_FIELDS = {"era_progress", "farm_plots"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    player_key TEXT PRIMARY KEY,
+    player_name TEXT NOT NULL,
+    avatar TEXT,
+    dark_mode INTEGER,
+    last_save TEXT,
+    level INTEGER,
+    xp INTEGER,
+    energy INTEGER,
+    money INTEGER,
+    seeds INTEGER,
+    water INTEGER,
+    fertilizer INTEGER,
+    current_era TEXT,
+    day INTEGER,
+    active_events TEXT,
+    completed_challenges TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS players_leaderboard ON players (level DESC, xp DESC, money DESC);
+CREATE INDEX IF NOT EXISTS players_last_save ON players (last_save DESC);
+
+CREATE TABLE IF NOT EXISTS era_progress (
+    player_key TEXT NOT NULL REFERENCES players (player_key) ON DELETE CASCADE,
+    era TEXT NOT NULL,
+    unlocked INTEGER NOT NULL,
+    events_completed INTEGER NOT NULL,
+    completed INTEGER NOT NULL,
+    PRIMARY KEY (player_key, era)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS farm_plots (
+    player_key TEXT NOT NULL REFERENCES players (player_key) ON DELETE CASCADE,
+    slot INTEGER NOT NULL,
+    crop TEXT,
+    planted_day INTEGER,
+    health INTEGER,
+    watered INTEGER NOT NULL,
+    PRIMARY KEY (player_key, slot)
+) WITHOUT ROWID;
+"""
+
+UPSERT_PLAYER = (
+    f"INSERT INTO players (player_key, {', '.join(PLAYER_COLUMNS)}, extra) "
+    f"VALUES (?, {', '.join('?' for _ in PLAYER_COLUMNS)}, ?) "
+    f"ON CONFLICT (player_key) DO UPDATE SET "
+    + ", ".join(f"{col} = excluded.{col}" for col in PLAYER_COLUMNS + ("extra",))
+)
+
+
+class SqliteSaveBackend:
+    """All players in one WAL-mode SQLite database with normalized progress and plot tables"""
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Writes come from SaveWriter's thread; SaveWriter serializes access with its own lock
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+
+    def _player_row(self, key, data):
+        row = [key]
+        for col in PLAYER_COLUMNS:
+            value = data.get(col)
+            row.append(json.dumps(value, ensure_ascii=False) if col in JSON_COLUMNS and value is not None else value)
+        extra = {k: v for k, v in data.items() if k not in PLAYER_COLUMNS and k not in TABLE_FIELDS}
+        row.append(json.dumps(extra, ensure_ascii=False) if extra else None)
+        return row
+
+    def save_many(self, batch):
+        """Write every player in the batch in a single transaction"""
+        players, keys, progress, plots = [], [], [], []
+        for player_name, data in batch.items():
+            key = safe_player_name(player_name)
+            keys.append((key,))
+            players.append(self._player_row(key, data))
+            for era, p in (data.get("era_progress") or {}).items():
+                progress.append((key, era, int(p["unlocked"]), p["events_completed"], int(p["completed"])))
+            for slot, plot in enumerate(data.get("farm_plots") or []):
+                plots.append((key, slot, plot["crop"], plot["planted_day"], plot["health"], int(plot["watered"])))
+
+        with self.conn:
+            self.conn.executemany(UPSERT_PLAYER, players)
+            self.conn.executemany("DELETE FROM era_progress WHERE player_key = ?", keys)
+            self.conn.executemany("DELETE FROM farm_plots WHERE player_key = ?", keys)
+            self.conn.executemany(
+                "INSERT INTO era_progress (player_key, era, unlocked, events_completed, completed) VALUES (?, ?, ?, ?, ?)",
+                progress,
+            )
+            self.conn.executemany(
+                "INSERT INTO farm_plots (player_key, slot, crop, planted_day, health, watered) VALUES (?, ?, ?, ?, ?, ?)",
+                plots,
+            )
+
+    def load(self, player_name):
+        key = safe_player_name(player_name)
+        row = self.conn.execute("SELECT * FROM players WHERE player_key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        data = {}
+        for col in PLAYER_COLUMNS:
+            value = row[col]
+            if value is not None:
+                data[col] = json.loads(value) if col in JSON_COLUMNS else value
+        if "dark_mode" in data:
+            data["dark_mode"] = bool(data["dark_mode"])
+        if row["extra"]:
+            data.update(json.loads(row["extra"]))
+
+        data["era_progress"] = {
+            r["era"]: {"unlocked": bool(r["unlocked"]), "events_completed": r["events_completed"], "completed": bool(r["completed"])}
+            for r in self.conn.execute("SELECT * FROM era_progress WHERE player_key = ?", (key,))
+        }
+        data["farm_plots"] = [
+            {"crop": r["crop"], "planted_day": r["planted_day"], "health": r["health"], "watered": bool(r["watered"])}
+            for r in self.conn.execute("SELECT * FROM farm_plots WHERE player_key = ? ORDER BY slot", (key,))
+        ]
+        return data
+
+    def list_players(self, limit=100, offset=0):
+        """Most recently saved players first (players_last_save index)"""
+        rows = self.conn.execute(
+            "SELECT player_name FROM players ORDER BY last_save DESC LIMIT ? OFFSET ?", (limit, offset)
+        )
+        return [r["player_name"] for r in rows]
+
+    def leaderboard(self, limit=10):
+        """Top players by level, then XP, then money (players_leaderboard index)"""
+        rows = self.conn.execute(
+            "SELECT player_name, level, xp, money FROM players ORDER BY level DESC, xp DESC, money DESC LIMIT ?",
+            (limit,),
+        )
+        return [dict(r) for r in rows]
+
+    def close(self):
+        self.conn.close()
+
+
+def open_save_backend(kind, saves_dir, encoding="json"):
+    """'json' for per-player files, 'sqlite' for saves_dir/shambabyte.db"""
+    if kind == "sqlite":
+        return SqliteSaveBackend(Path(saves_dir) / "shambabyte.db")
+    return JournalSaveBackend(saves_dir, encoding)
+
+
+def import_json_saves(backend, saves_dir):
+    """Copy every *_save.json (plus any journal) in saves_dir into backend; returns the count"""
+    batch = {}
+    for path in sorted(Path(saves_dir).glob("*_save.json")):
+        data = JournaledSave(saves_dir, path.name[:-len("_save.json")]).load()
+        if data:
+            batch[data.get("player_name") or path.name[:-len("_save.json")]] = data
+    if batch:
+        backend.save_many(batch)
+    return len(batch)
+
+
+class SaveWriter:
+    """Coalesces saves per player and writes them on a background thread.
+
+    A write happens once no new save has arrived for `delay` seconds, and never
+    later than `max_delay` seconds after the first unwritten save.
+    """
+
+    def __init__(self, backend, delay=0.5, max_delay=2.0):
+        self.backend = backend
+        self.delay = delay
+        self.max_delay = max_delay
+        self.pending = {}
+        self.first_pending_at = None
+        self.last_submit_at = None
+        # Latest failed write per player, kept until that player's session collects it
+        self.errors = {}
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def submit(self, player_name, data):
+        """Queue a full save; only the latest state per player is kept"""
+        snapshot = copy.deepcopy(data)
+        with self._cond:
+            now = time.monotonic()
+            if not self.pending:
+                self.first_pending_at = now
+            self.pending[player_name] = snapshot
+            self.last_submit_at = now
+            self._cond.notify()
+
+    def load(self, player_name):
+        with self._io_lock:
+            return self.backend.load(player_name)
+
+    def take_error(self, player_name):
+        """The exception from this player's last failed write, cleared once returned"""
+        with self._cond:
+            return self.errors.pop(player_name, None)
+
+    def flush(self):
+        """Write everything pending right now"""
+        with self._cond:
+            batch, self.pending = self.pending, {}
+        self._write(batch)
+
+    def _write(self, batch):
+        if not batch:
+            return
+        with self._io_lock:
+            try:
+                self.backend.save_many(batch)
+                error = None
+            except Exception as e:
+                error = e
+        with self._cond:
+            for player_name in batch:
+                # A later successful full save supersedes an earlier failure
+                if error is None:
+                    self.errors.pop(player_name, None)
+                else:
+                    self.errors[player_name] = error
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self.pending:
+                    self._cond.wait()
+                while True:
+                    now = time.monotonic()
+                    quiet_until = self.last_submit_at + self.delay
+                    deadline = self.first_pending_at + self.max_delay
+                    wake_at = min(quiet_until, deadline)
+                    if now >= wake_at:
+                        break
+                    self._cond.wait(wake_at - now)
+                batch, self.pending = self.pending, {}
+            self._write(batch)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import *_save.json files into the SQLite save store")
+    parser.add_argument("saves_dir", nargs="?", default="saves")
+    parser.add_argument("--db", help="database path (default: <saves_dir>/shambabyte.db)")
+    args = parser.parse_args()
+
+    store = SqliteSaveBackend(args.db or Path(args.saves_dir) / "shambabyte.db")
+    count = import_json_saves(store, args.saves_dir)
+    print(f"Imported {count} save(s) into {store.db_path}")
+    store.close()
@@ -0,0 +1,146 @@
+"""Headless batch runs of farm strategies across every era, using farm_rules.
+
+    python simulate.py --runs 2000
+    python simulate.py --strategy greedy --era 1980s --runs 500 --workers 4
+
+Runs are split into chunks across a process pool. Each worker builds its
+DayEngine once from the shared climate cache. The report gives per-strategy,
+per-era outcomes and overall throughput in simulated days per second.
+"""
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import farm_rules
+from farm_engine import DayEngine
+from farm_rules import CROP_TYPES, ERA_ORDER
+
+CHUNK_SIZE = 50
+
+# Crop with the best value per growing day
+BEST_CROP = max(CROP_TYPES, key=lambda crop: CROP_TYPES[crop]['value'] / CROP_TYPES[crop]['days'])
+
+
+def greedy(state, rng):
+    """Harvest what's ready, replant the best crop, water anything below full health"""
+    for i, plot in enumerate(state['farm_plots']):
+        if farm_rules.is_ready(state, plot):
+            farm_rules.harvest(state, i)
+        if plot['crop'] is None:
+            if state['seeds'] < 1:
+                farm_rules.buy_seeds(state, BEST_CROP)
+            farm_rules.plant(state, i, BEST_CROP)
+        elif plot['health'] < 100:
+            if state['water'] < farm_rules.WATER_COST:
+                farm_rules.buy_water(state)
+            farm_rules.water_plot(state, i)
+
+
+def random_play(state, rng):
+    """Each plot gets one random action a day"""
+    for i, plot in enumerate(state['farm_plots']):
+        action = rng.random()
+        if plot['crop'] is None:
+            if action < 0.5:
+                farm_rules.plant(state, i, rng.choice(list(CROP_TYPES)))
+        elif action < 0.4:
+            farm_rules.harvest(state, i)
+        elif action < 0.8:
+            farm_rules.water_plot(state, i)
+    if rng.random() < 0.05:
+        farm_rules.buy_seeds(state, rng.choice(list(CROP_TYPES)))
+    if rng.random() < 0.05:
+        farm_rules.buy_water(state)
+
+
+def plant_only(state, rng):
+    """Plant and harvest, never water"""
+    for i, plot in enumerate(state['farm_plots']):
+        if farm_rules.is_ready(state, plot):
+            farm_rules.harvest(state, i)
+        if plot['crop'] is None:
+            farm_rules.plant(state, i, BEST_CROP)
+
+
+STRATEGIES = {"greedy": greedy, "random": random_play, "plant_only": plant_only}
+
+_engine = None
+
+
+def _init_worker():
+    global _engine
+    _engine = DayEngine()
+
+
+def play_era(strategy, era, seed, engine):
+    """One scripted run of era from its first day; returns (final state, days simulated)"""
+    rng = random.Random(seed)
+    state = farm_rules.new_state()
+    farm_rules.enter_era(state, era)
+    days = 0
+    while True:
+        strategy(state, rng)
+        days += 1
+        if farm_rules.next_day(state, engine):
+            return state, days
+
+
+def run_chunk(task):
+    """Play a range of seeds for one (strategy, era); returns summed outcomes"""
+    strategy_name, era, seeds = task
+    strategy = STRATEGIES[strategy_name]
+    totals = {"runs": 0, "days": 0, "money": 0, "xp": 0, "health": 0}
+    for seed in seeds:
+        state, days = play_era(strategy, era, seed, _engine)
+        totals["runs"] += 1
+        totals["days"] += days
+        totals["money"] += state['money']
+        totals["xp"] += state['xp']
+        totals["health"] += sum(plot['health'] for plot in state['farm_plots']) / len(state['farm_plots'])
+    return strategy_name, era, totals
+
+
+def make_tasks(strategies, eras, runs, chunk_size=CHUNK_SIZE):
+    for strategy in strategies:
+        for era in eras:
+            for start in range(0, runs, chunk_size):
+                yield strategy, era, range(start, min(start + chunk_size, runs))
+
+
+def run_batch(strategies, eras, runs, workers=None):
+    """{(strategy, era): summed outcomes}, plus elapsed seconds"""
+    results = {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        for strategy, era, totals in pool.map(run_chunk, make_tasks(strategies, eras, runs)):
+            merged = results.setdefault((strategy, era), dict.fromkeys(totals, 0))
+            for key, value in totals.items():
+                merged[key] += value
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run farm strategies headlessly across eras")
+    parser.add_argument("--strategy", action="append", choices=sorted(STRATEGIES), help="strategy to run (repeatable, default all)")
+    parser.add_argument("--era", action="append", choices=ERA_ORDER, help="era to run (repeatable, default all)")
+    parser.add_argument("--runs", type=int, default=1000, help="runs per strategy and era")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    args = parser.parse_args()
+
+    strategies = args.strategy or sorted(STRATEGIES)
+    eras = args.era or ERA_ORDER
+    results, elapsed = run_batch(strategies, eras, args.runs, args.workers)
+
+    print(f"{'strategy':<11} {'era':<6} {'runs':>6} {'money':>9} {'xp':>7} {'health':>7}")
+    for (strategy, era), totals in sorted(results.items()):
+        n = totals["runs"]
+        print(f"{strategy:<11} {era:<6} {n:>6} {totals['money'] / n:>9.0f} {totals['xp'] / n:>7.0f} {totals['health'] / n:>7.1f}")
+
+    days = sum(totals["days"] for totals in results.values())
+    print(f"\n{days:,} simulated days in {elapsed:.2f} s on {args.workers} workers: {days / elapsed:,.0f} days/sec")
+
+
+if __name__ == "__main__":
+    main()
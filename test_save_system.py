@@ -0,0 +1,108 @@
+import time
+
+import pytest
+
+from save_system import JournaledSave, SaveWriter
+
+
+@pytest.mark.parametrize("encoding", ["json", "msgpack"])
+def test_torn_journal_entry_is_dropped(tmp_path, encoding):
+    save = JournaledSave(tmp_path, "Wanjiku", encoding)
+    save.save({"money": 100, "day": 1})
+    save.save({"money": 150, "day": 1})
+    save.save({"money": 150, "day": 2})
+    with open(save.journal_path, "ab") as f:
+        # First half of an entry, as left by a crash mid-append
+        f.write(save.journal_path.read_bytes()[:5])
+
+    reloaded = JournaledSave(tmp_path, "Wanjiku", encoding)
+    assert reloaded.load() == {"money": 150, "day": 2}
+
+    # The next append must not be glued onto the torn bytes
+    reloaded.save({"money": 5, "day": 9})
+    assert JournaledSave(tmp_path, "Wanjiku", encoding).load() == {"money": 5, "day": 9}
+
+
+def test_failed_append_is_retried_by_the_next_save(tmp_path, monkeypatch):
+    save = JournaledSave(tmp_path, "Wanjiku")
+    save.save({"money": 1})
+
+    def fail(delta):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(save, "_append", fail)
+    with pytest.raises(OSError):
+        save.save({"money": 2})
+    monkeypatch.undo()
+
+    assert save.save({"money": 2}) > 0
+    assert JournaledSave(tmp_path, "Wanjiku").load() == {"money": 2}
+
+
+def test_stale_journal_after_crash_mid_compaction_is_skipped(tmp_path):
+    save = JournaledSave(tmp_path, "Wanjiku", compact_every=2)
+    for money in (100, 110, 120):
+        save.save({"money": money})
+    stale_journal = save.journal_path.read_bytes()
+    save.save({"money": 130})
+    assert not save.journal_path.exists()
+
+    # Crash after the snapshot rename but before the journal was removed
+    save.journal_path.write_bytes(stale_journal)
+    reloaded = JournaledSave(tmp_path, "Wanjiku", compact_every=2)
+    assert reloaded.load() == {"money": 130}
+
+    reloaded.save({"money": 140})
+    assert JournaledSave(tmp_path, "Wanjiku").load() == {"money": 140}
+
+
+class RecordingBackend:
+    def __init__(self, fail_for=()):
+        self.fail_for = set(fail_for)
+        self.batches = []
+
+    def save_many(self, batch):
+        if self.fail_for & set(batch):
+            raise OSError("disk full")
+        self.batches.append(batch)
+
+    def load(self, player_name):
+        return None
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.01)
+
+
+def test_rapid_saves_are_coalesced_into_one_write():
+    backend = RecordingBackend()
+    writer = SaveWriter(backend, delay=0.05, max_delay=5)
+    for day in range(10):
+        writer.submit("Wanjiku", {"day": day})
+    writer.submit("Otieno", {"day": 3})
+
+    wait_for(lambda: backend.batches)
+    time.sleep(0.1)
+    assert backend.batches == [{"Wanjiku": {"day": 9}, "Otieno": {"day": 3}}]
+
+
+def test_write_errors_are_reported_to_the_failing_player_only():
+    backend = RecordingBackend(fail_for={"Wanjiku"})
+    writer = SaveWriter(backend, delay=5, max_delay=5)
+    writer.submit("Wanjiku", {"day": 1})
+    writer.flush()
+    writer.submit("Otieno", {"day": 1})
+    writer.flush()
+
+    assert writer.take_error("Otieno") is None
+    assert isinstance(writer.take_error("Wanjiku"), OSError)
+    assert writer.take_error("Wanjiku") is None
+
+    backend.fail_for.clear()
+    writer.submit("Wanjiku", {"day": 2})
+    writer.flush()
+    assert writer.take_error("Wanjiku") is None
@@ -0,0 +1,195 @@
+"""UI translation with an in-memory LRU, a persistent SQLite store and batched model calls.
+
+Lookups hit the precompiled catalog (see i18n_catalog.py) first, then the LRU,
+then the on-disk store keyed by (text, lang, model).
+Only strings missing from all three reach the model. prefetch() sends all of a
+screen's missing strings in one request, so the first Kiswahili render costs
+one round-trip instead of one per string.
+"""
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+DEFAULT_STORE_PATH = Path(__file__).with_name(".cache") / "translations.db"
+BATCH_SIZE = 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    text TEXT NOT NULL,
+    lang TEXT NOT NULL,
+    model TEXT NOT NULL,
+    translated TEXT NOT NULL,
+    PRIMARY KEY (text, lang, model)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS screen_strings (
+    screen TEXT NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (screen, text)
+) WITHOUT ROWID;
+"""
+
+
+class StubModel:
+    """Offline stand-in for genai.GenerativeModel, for tests and benchmarks"""
+
+    model_name = "stub"
+
+    class Response:
+        def __init__(self, text):
+            self.text = text
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+
+    def generate_content(self, prompt):
+        self.calls += 1
+        time.sleep(self.latency)
+        lang = re.search(r"to (\w+)", prompt).group(1)
+        match = re.search(r"\[.*\]", prompt, re.S)
+        if match:
+            texts = json.loads(match.group(0))
+            return self.Response(json.dumps([f"[{lang}] {text}" for text in texts], ensure_ascii=False))
+        return self.Response(f"[{lang}] {prompt.split(': ', 1)[1]}")
+
+
+def parse_batch_reply(reply, expected):
+    """The JSON array from a batch reply, or None if it doesn't line up with the request.
+
+    Blank items come back as None so those strings stay misses instead of caching an empty label.
+    """
+    match = re.search(r"\[.*\]", reply, re.S)
+    if not match:
+        return None
+    try:
+        items = json.loads(match.group(0))
+    except ValueError:
+        return None
+    if not isinstance(items, list) or len(items) != expected:
+        return None
+    translations = []
+    for item in items:
+        translated = "" if item is None else str(item).strip()
+        translations.append(translated or None)
+    return translations
+
+
+class Translator:
+    def __init__(self, model, store_path=DEFAULT_STORE_PATH, max_entries=2000, catalog=None):
+        self.model = model
+        self.catalog = catalog or {}
+        self.model_name = getattr(model, "model_name", "none") if model else "none"
+        self.max_entries = max_entries
+        self.lru = OrderedDict()
+        self.screens = {}
+        self.lock = threading.Lock()
+
+        self.conn = None
+        if store_path:
+            Path(store_path).parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(store_path, check_same_thread=False)
+            self.conn.executescript(SCHEMA)
+
+    def _remember(self, text, lang, translated):
+        self.lru[(text, lang)] = translated
+        self.lru.move_to_end((text, lang))
+        if len(self.lru) > self.max_entries:
+            self.lru.popitem(last=False)
+
+    def lookup(self, text, lang):
+        """Catalog or cached translation (memory, then disk), or None if the model has to be asked"""
+        if lang == 'English':
+            return text
+        compiled = self.catalog.get(lang, {}).get(text)
+        if compiled is not None:
+            return compiled
+        if not self.model:
+            return text
+        with self.lock:
+            cached = self.lru.get((text, lang))
+            if cached is not None:
+                self.lru.move_to_end((text, lang))
+                return cached
+            if self.conn is None:
+                return None
+            row = self.conn.execute(
+                "SELECT translated FROM translations WHERE text = ? AND lang = ? AND model = ? AND translated != ''",
+                (text, lang, self.model_name),
+            ).fetchone()
+            if row is None:
+                return None
+            self._remember(text, lang, row[0])
+            return row[0]
+
+    def _store(self, pairs, lang):
+        with self.lock:
+            for text, translated in pairs:
+                self._remember(text, lang, translated)
+            if self.conn is not None:
+                with self.conn:
+                    self.conn.executemany(
+                        "INSERT OR REPLACE INTO translations (text, lang, model, translated) VALUES (?, ?, ?, ?)",
+                        [(text, lang, self.model_name, translated) for text, translated in pairs],
+                    )
+
+    def translate(self, text, lang):
+        """Translate one string, calling the model only on a cache miss"""
+        cached = self.lookup(text, lang)
+        if cached is not None:
+            return cached
+        try:
+            prompt = f"Translate this to {lang}, keeping emojis: {text}"
+            translated = self.model.generate_content(prompt).text.strip()
+        except Exception:
+            return text
+        if not translated:
+            return text
+        self._store([(text, translated)], lang)
+        return translated
+
+    def prefetch(self, texts, lang):
+        """Translate every uncached string in texts with one request per BATCH_SIZE; returns how many were added"""
+        if lang == 'English' or not self.model:
+            return 0
+        missing = list(dict.fromkeys(text for text in texts if self.lookup(text, lang) is None))
+        added = 0
+        for i in range(0, len(missing), BATCH_SIZE):
+            chunk = missing[i:i + BATCH_SIZE]
+            prompt = (
+                f"Translate each string in this JSON array to {lang}, keeping emojis and order. "
+                f"Reply with only a JSON array of the same length.\n{json.dumps(chunk, ensure_ascii=False)}"
+            )
+            try:
+                translations = parse_batch_reply(self.model.generate_content(prompt).text, len(chunk))
+            except Exception:
+                translations = None
+            pairs = [(text, translated) for text, translated in zip(chunk, translations or []) if translated]
+            if pairs:
+                self._store(pairs, lang)
+                added += len(pairs)
+        return added
+
+    def remember_screen(self, screen, texts):
+        """Record which strings a screen renders, so later visits can prefetch them up front"""
+        new = set(texts) - set(self.screen_texts(screen))
+        if not new:
+            return
+        with self.lock:
+            self.screens[screen].update(new)
+            if self.conn is not None:
+                with self.conn:
+                    self.conn.executemany(
+                        "INSERT OR IGNORE INTO screen_strings (screen, text) VALUES (?, ?)",
+                        [(screen, text) for text in new],
+                    )
+
+    def screen_texts(self, screen):
+        with self.lock:
+            if screen not in self.screens:
+                rows = self.conn.execute("SELECT text FROM screen_strings WHERE screen = ?", (screen,)) if self.conn else []
+                self.screens[screen] = {row[0] for row in rows}
+            return list(self.screens[screen])